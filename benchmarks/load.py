@@ -0,0 +1,257 @@
+"""Нагрузочный прогон всех эндпоинтов /books против запущенного приложения.
+
+Перед запуском наполните БД (python -m benchmarks.seed --size 10k) и
+запустите приложение. Затем из корня проекта:
+    python -m benchmarks.load --base-url http://localhost:8000 --catalog-size 10000 \\
+        --concurrency 32 --requests 2000 --output bench_output.json
+
+Для каждого сценария выводится JSON: пропускная способность (rps),
+задержки p50/p95/p99/max в миллисекундах и количество ошибок.
+
+Засеянный каталог прогон не меняет: изменение и удаление выполняются
+только над книгами, созданными сценарием create_book в этом же прогоне,
+поэтому без него (например, с --only patch_book) они пропускаются.
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+import uuid
+
+import httpx
+
+from src.constants import CURRENT_YEAR
+from src.utils.pagination import encode_cursor
+
+
+class Scenario:
+    """Сценарий нагрузки: строит запрос и проверяет ответ.
+
+        Attributes:
+            name: Имя сценария в отчете.
+            expected_status: Статус ответа, который считается успешным.
+            stream: Для потоковых ответов измеряется время до первого байта.
+            uses_created_ids: Сценарий работает с книгами, созданными в этом
+                прогоне, и пропускается, если их нет.
+    """
+
+    expected_status = 200
+    stream = False
+    uses_created_ids = False
+
+    def __init__(self, name: str, build):
+        """Args:
+                name (str): Имя сценария в отчете.
+                build: Callable (rng, context) -> dict аргументов httpx.request.
+        """
+        self.name = name
+        self.build = build
+
+    def on_response(self, response: httpx.Response, context: dict):
+        """Вызывается после успешного ответа (например, чтобы запомнить ID)."""
+
+
+class CreateScenario(Scenario):
+    """Создание книг; ID созданных книг передаются сценарию удаления."""
+
+    def on_response(self, response, context):
+        context["created_ids"].append(response.json()["book"]["id"])
+
+
+class UpdateScenario(Scenario):
+    """Изменение книг, созданных сценарием создания в этом же прогоне."""
+
+    uses_created_ids = True
+
+
+class DeleteScenario(Scenario):
+    """Удаление книг, созданных сценарием создания в этом же прогоне."""
+
+    uses_created_ids = True
+
+    def __init__(self, name):
+        super().__init__(name, self._build)
+
+    @staticmethod
+    def _build(rng, context):
+        return {"method": "DELETE", "url": f"/books/{context['created_ids'].pop()}"}
+
+
+def random_id(rng, context) -> int:
+    return rng.randint(1, context["catalog_size"])
+
+
+def created_id(rng, context) -> int:
+    return rng.choice(context["created_ids"])
+
+
+def unique_title(context) -> str:
+    context["counter"] += 1
+    return f"bench {context['run_id']} {context['counter']}"
+
+
+SCENARIOS = [
+    Scenario("get_book", lambda rng, ctx: {
+        "method": "GET", "url": f"/books/{random_id(rng, ctx)}"}),
+    Scenario("list_books", lambda rng, ctx: {
+        "method": "GET", "url": "/books", "params": {"page": rng.randint(1, 50)}}),
+    Scenario("list_books_deep_page", lambda rng, ctx: {
+        "method": "GET", "url": "/books",
+        "params": {"page": max(1, ctx["catalog_size"] // 3 - rng.randint(0, 50)), "per_page": 3}}),
+    Scenario("list_books_cursor", lambda rng, ctx: {
+        "method": "GET", "url": "/books", "params": {"cursor": ctx["cursor"](random_id(rng, ctx))}}),
+    Scenario("list_books_filtered", lambda rng, ctx: {
+        "method": "GET", "url": "/books",
+        "params": {"title": rng.choice(["сад", "берег", "river", "empire"]),
+                   "author": rng.choice(["толст", "булгак", "orwell"]),
+                   "per_page": 20}}),
+    Scenario("list_books_years", lambda rng, ctx: {
+        "method": "GET", "url": "/books",
+        "params": {"year_from": (year := rng.randint(1700, CURRENT_YEAR - 10)),
+                   "year_to": year + 10, "per_page": 20}}),
+    CreateScenario("create_book", lambda rng, ctx: {
+        "method": "POST", "url": "/books",
+        "json": {"title": unique_title(ctx), "author": "Benchmark", "date_of_writing": 2000}}),
+    Scenario("create_books_bulk", lambda rng, ctx: {
+        "method": "POST", "url": "/books/bulk",
+        "json": [{"title": unique_title(ctx), "author": "Benchmark"} for _ in range(100)]}),
+    UpdateScenario("patch_book", lambda rng, ctx: {
+        "method": "PATCH", "url": f"/books/{created_id(rng, ctx)}",
+        "json": {"date_of_writing": rng.randint(1700, CURRENT_YEAR)}}),
+    UpdateScenario("put_book", lambda rng, ctx: {
+        "method": "PUT", "url": f"/books/{(book_id := created_id(rng, ctx))}",
+        "json": {"title": f"bench put {book_id}", "author": "Benchmark",
+                 "date_of_writing": rng.randint(1700, CURRENT_YEAR)}}),
+    DeleteScenario("delete_book"),
+]
+STREAM_SCENARIOS = [
+    Scenario("export_ndjson_ttfb", lambda rng, ctx: {
+        "method": "GET", "url": "/books/export", "params": {"format": "ndjson"}}),
+    Scenario("export_csv_ttfb", lambda rng, ctx: {
+        "method": "GET", "url": "/books/export", "params": {"format": "csv"}}),
+]
+for scenario in STREAM_SCENARIOS:
+    scenario.stream = True
+    SCENARIOS.append(scenario)
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Перцентиль методом ближайшего ранга."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+async def send(client: httpx.AsyncClient, scenario: Scenario, request: dict) -> httpx.Response:
+    """Отправляет запрос; для потоковых сценариев читает только первый фрагмент."""
+    if not scenario.stream:
+        return await client.request(**request)
+    async with client.stream(**request) as response:
+        async for _ in response.aiter_raw():
+            break
+        return response
+
+
+async def run_scenario(client, scenario: Scenario, requests: int, concurrency: int,
+                       context: dict, seed: int) -> dict:
+    """Выполняет сценарий заданное число раз с ограниченной конкурентностью."""
+    rng = random.Random(f"{seed}:{scenario.name}")
+    latencies, errors = [], 0
+    remaining = requests
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            request = scenario.build(rng, context)
+            start = time.perf_counter()
+            try:
+                response = await send(client, scenario, request)
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+            if response.status_code != scenario.expected_status:
+                errors += 1
+            elif not scenario.stream:
+                scenario.on_response(response, context)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests": requests,
+        "errors": errors,
+        "concurrency": concurrency,
+        "elapsed_s": elapsed,
+        "rps": requests / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "max_ms": (latencies[-1] if latencies else 0.0) * 1000,
+    }
+
+
+async def run(args) -> dict:
+    """Прогоняет выбранные сценарии по очереди и собирает отчет."""
+    context = {
+        "catalog_size": args.catalog_size,
+        "run_id": uuid.uuid4().hex[:8],
+        "counter": 0,
+        "created_ids": [],
+        "cursor": lambda book_id: encode_cursor(id=book_id),
+    }
+    selected = [s for s in SCENARIOS if not args.only or s.name in args.only]
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    report = {"base_url": args.base_url, "catalog_size": args.catalog_size,
+              "seed": args.seed, "scenarios": {}}
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+        for scenario in selected:
+            requests = args.requests
+            if scenario.uses_created_ids and not context["created_ids"]:
+                continue
+            if isinstance(scenario, DeleteScenario):
+                requests = min(requests, len(context["created_ids"]))
+            if requests == 0:
+                continue
+            await run_scenario(client, scenario, min(args.warmup, requests),
+                               args.concurrency, context, args.seed)
+            if isinstance(scenario, DeleteScenario):
+                requests = min(requests, len(context["created_ids"]))
+            report["scenarios"][scenario.name] = await run_scenario(
+                client, scenario, requests, args.concurrency, context, args.seed)
+            print(f"{scenario.name}: {report['scenarios'][scenario.name]}", file=sys.stderr)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--catalog-size", type=int, required=True,
+                        help="Размер каталога, загруженного benchmarks.seed")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=1000, help="Запросов на сценарий")
+    parser.add_argument("--warmup", type=int, default=50, help="Прогревочных запросов на сценарий")
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--only", nargs="*", help="Запустить только указанные сценарии")
+    parser.add_argument("--output", help="Файл для JSON-отчета (по умолчанию stdout)")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2)
+            output.write("\n")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
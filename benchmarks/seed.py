@@ -0,0 +1,92 @@
+"""Наполнение БД детерминированным синтетическим каталогом книг.
+
+Запуск из корня проекта (подключение берется из .env / переменных окружения):
+    python -m benchmarks.seed --size 10k
+    python -m benchmarks.seed --size 1m --seed 7
+
+Таблица book очищается (TRUNCATE ... RESTART IDENTITY), поэтому после
+наполнения книги имеют ID от 1 до size - на это опирается benchmarks.load.
+"""
+import argparse
+import asyncio
+import random
+import time
+
+import asyncpg
+
+from src.config.config import settings
+from src.constants import CURRENT_YEAR
+
+SIZES = {"10k": 10_000, "1m": 1_000_000, "10m": 10_000_000}
+CHUNK_SIZE = 50_000
+
+ADJECTIVES = ["Тихий", "Последний", "Золотой", "Дальний", "Белый", "Старый",
+              "Красный", "Забытый", "Ночной", "Северный", "Lost", "Silent",
+              "Broken", "Hidden", "Endless", "Distant"]
+NOUNS = ["Дон", "сад", "берег", "город", "путь", "ветер", "мир", "дом",
+         "River", "Garden", "Empire", "Voyage", "Kingdom", "Shadow"]
+FIRST_NAMES = ["Лев", "Михаил", "Анна", "Иван", "Мария", "Федор", "Николай",
+               "Ольга", "John", "Jane", "George", "Virginia", "Ernest"]
+LAST_NAMES = ["Толстой", "Булгаков", "Ахматова", "Бунин", "Цветаева",
+              "Достоевский", "Гоголь", "Берггольц", "Steinbeck", "Austen",
+              "Orwell", "Woolf", "Hemingway"]
+
+
+def parse_size(value: str) -> int:
+    """Принимает размер каталога как 10k/1m/10m или целое число."""
+    return SIZES.get(value.lower()) or int(value)
+
+
+def generate_books(size: int, seed: int):
+    """Порциями генерирует строки (title, author, date_of_writing).
+
+        Одинаковые size и seed всегда дают одинаковый каталог. Номер книги
+        входит в название, поэтому названия уникальны.
+    """
+    rng = random.Random(seed)
+    chunk = []
+    for number in range(1, size + 1):
+        year = None if rng.random() < 0.05 else rng.randint(1700, CURRENT_YEAR)
+        chunk.append((
+            f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {number}",
+            f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            year,
+        ))
+        if len(chunk) == CHUNK_SIZE:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def seed_catalog(size: int, seed: int):
+    """Очищает таблицу book и загружает в нее каталог через COPY."""
+    dsn = settings.DB_URL.replace("postgresql+asyncpg://", "postgresql://")
+    connection = await asyncpg.connect(dsn)
+    try:
+        await connection.execute("TRUNCATE book RESTART IDENTITY")
+        loaded = 0
+        for chunk in generate_books(size, seed):
+            await connection.copy_records_to_table(
+                "book", records=chunk, columns=["title", "author", "date_of_writing"])
+            loaded += len(chunk)
+            print(f"loaded {loaded}/{size}", flush=True)
+        await connection.execute("ANALYZE book")
+    finally:
+        await connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=parse_size, default=SIZES["10k"],
+                        help="Размер каталога: 10k, 1m, 10m или число")
+    parser.add_argument("--seed", type=int, default=1, help="Зерно генератора")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    asyncio.run(seed_catalog(args.size, args.seed))
+    print(f"seeded {args.size} books in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
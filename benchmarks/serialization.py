@@ -0,0 +1,69 @@
+"""Сравнение сериализации страницы списка книг: Pydantic-путь и orjson-путь.
+
+Запуск из корня проекта (БД не требуется):
+    python -m benchmarks.serialization --rows 1000 --repeat 200
+"""
+import argparse
+import json
+import sys
+import timeit
+from types import SimpleNamespace
+
+import orjson
+from pydantic import TypeAdapter
+
+from src.schemas.books import BooksResponse
+
+RESPONSE_ADAPTER = TypeAdapter(dict[str, str | int | list[BooksResponse | None] | None])
+
+
+def make_rows(count: int) -> list[dict]:
+    """Строит детерминированную страницу книг в виде словарей колонок."""
+    return [
+        {
+            "id": i,
+            "title": f"Book title {i}",
+            "author": f"Author {i % 997}",
+            "date_of_writing": 1800 + i % 225,
+            "version": 1,
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def pydantic_path(models: list) -> bytes:
+    """Прежний путь: маппинг ORM-объектов в схемы и валидация ответа FastAPI."""
+    books = [BooksResponse.model_validate(model, from_attributes=True) for model in models]
+    content = RESPONSE_ADAPTER.validate_python(
+        {"status_code": 200, "books": books, "next_cursor": None})
+    return json.dumps(RESPONSE_ADAPTER.dump_python(content, mode="json"),
+                      ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def orjson_path(rows: list[dict]) -> bytes:
+    """Быстрый путь: словари колонок сериализуются напрямую в JSON-байты."""
+    return orjson.dumps({"status_code": 200, "books": rows, "next_cursor": None})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000, help="Строк на странице")
+    parser.add_argument("--repeat", type=int, default=200, help="Количество повторов")
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    models = [SimpleNamespace(**row) for row in rows]
+    assert json.loads(pydantic_path(models)) == json.loads(orjson_path(rows))
+
+    report = {"rows": args.rows, "repeat": args.repeat}
+    for name, func, data in (("pydantic", pydantic_path, models),
+                             ("orjson", orjson_path, rows)):
+        seconds = min(timeit.repeat(lambda: func(data), number=args.repeat, repeat=3))
+        report[name] = {"per_page_ms": seconds / args.repeat * 1000}
+    report["speedup"] = report["pydantic"]["per_page_ms"] / report["orjson"]["per_page_ms"]
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
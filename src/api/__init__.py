@@ -1,6 +1,12 @@
 from fastapi import APIRouter
 from src.api.books import router as book_router
+from src.api.health import router as health_router
+from src.api.metrics import router as metrics_router
+from src.api.stats import router as stats_router
 
 main_router = APIRouter()
 
 main_router.include_router(book_router)
+main_router.include_router(stats_router)
+main_router.include_router(metrics_router)
+main_router.include_router(health_router)
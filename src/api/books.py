@@ -1,7 +1,14 @@
-from fastapi import APIRouter, Path, Body, Query
+import asyncio
+from typing import Literal
 
+from fastapi import APIRouter, Path, Body, Query, Header, Response
+from fastapi.responses import StreamingResponse, ORJSONResponse
+
+from src.config.config import settings
+from src.config.db_config import database
+from src.config.db_context_manager import DBManager
 from src.constants import (API_RESPONSE, HTTP_200, HTTP_201,
-                           HTTP_404, HTTP_409, HTTP_422,
+                           HTTP_304, HTTP_400, HTTP_404, HTTP_409, HTTP_412, HTTP_422,
                            HTTP_204, API_PUT_DESCRIPTION,
                            API_PUT_SUMMARY, API_GET_SUMMARY,
                            API_GET_DESCRIPTION, API_PATCH_SUMMARY,
@@ -9,33 +16,176 @@ from src.constants import (API_RESPONSE, HTTP_200, HTTP_201,
                            API_PATCH_DESCRIPTION, API_DELETE_SUMMARY,
                            OPENAPI_EXAMPLES, API_DELETE_DESCRIPTION,
                            API_GET_ALL_DESCRIPTION, API_GET_ALL_SUMMARY,
-                           HTTP_200_LIST, CURRENT_YEAR)
-from src.dependencies.dependencies import DBDep
+                           HTTP_200_LIST, CURRENT_YEAR,
+                           API_BULK_RESPONSE, API_POST_BULK_SUMMARY,
+                           API_POST_BULK_DESCRIPTION, API_EXPORT_SUMMARY,
+                           API_EXPORT_DESCRIPTION, API_SEARCH_SUMMARY,
+                           API_SEARCH_DESCRIPTION, API_BULK_IDS_RESPONSE,
+                           API_PATCH_BULK_SUMMARY, API_PATCH_BULK_DESCRIPTION,
+                           API_DELETE_BULK_SUMMARY, API_DELETE_BULK_DESCRIPTION,
+                           API_UPSERT_SUMMARY, API_UPSERT_DESCRIPTION,
+                           API_BATCH_SUMMARY, API_BATCH_DESCRIPTION)
+from src.dependencies.dependencies import DBDep, IdsDep, books_insert_batcher
 from src.exceptions.exceptions import (ObjectNotFoundException,
                                        ObjectNotFoundHTTPException,
                                        UniqueObjectException,
-                                       UniqueObjectHTTPException)
+                                       UniqueObjectHTTPException,
+                                       InvalidCursorException,
+                                       InvalidCursorHTTPException,
+                                       InvalidFieldsException,
+                                       InvalidFieldsHTTPException,
+                                       VersionConflictException,
+                                       PreconditionFailedHTTPException)
 from src.schemas.books import (BooksResponse, BooksRequestAdd,
-                               BooksRequestPUT, BooksRequestPATCH)
+                               BooksRequestPUT, BooksRequestPATCH,
+                               BooksRequestBulkPATCH, BooksRequestUpsert,
+                               BooksRequestBatch)
+from src.utils.etag import (book_etag, list_etag, etag_matches, if_match_versions,
+                            projection_etag)
+from src.utils.fields import parse_fields, project
+from src.utils.export import to_ndjson, to_csv, EXPORT_MEDIA_TYPES
+from src.utils.pagination import encode_cursor, decode_cursor
 
 router = APIRouter(prefix="/books", tags=["Книги"])
 
 
+async def stream_books_export(export_format: str):
+    """Выгружает каталог в выбранном формате, удерживая собственную сессию БД.
+
+        Зависимость DBDep закрывает сессию до отправки тела ответа, поэтому
+        для потоковой выдачи сессия открывается внутри генератора и живет,
+        пока клиент читает выгрузку.
+    """
+    async with DBManager(session_factory=database.session_factory,
+                         read_session_factory=database.replica_router.pick()) as db:
+        books = db.books.stream_all(fetch_size=settings.EXPORT_FETCH_SIZE)
+        if export_format == "csv":
+            chunks = to_csv(books, fieldnames=list(BooksResponse.model_fields))
+        else:
+            chunks = to_ndjson(books)
+        async for chunk in chunks:
+            yield chunk
+
+
+@router.get(path="/export",
+            summary=API_EXPORT_SUMMARY,
+            description=API_EXPORT_DESCRIPTION)
+async def export_books(
+        export_format: Literal["ndjson", "csv"] = Query(
+            "ndjson", alias="format", description="Формат выгрузки")
+) -> StreamingResponse:
+    return StreamingResponse(
+        stream_books_export(export_format),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f"attachment; filename=books.{export_format}"}
+    )
+
+
+@router.get(path="/search",
+            responses={
+                HTTP_400: API_RESPONSE[HTTP_400],
+            },
+            summary=API_SEARCH_SUMMARY,
+            description=API_SEARCH_DESCRIPTION)
+async def search_books(
+        db: DBDep,
+        q: str = Query(min_length=1, description="Поисковый запрос по названию и автору"),
+        per_page: int = Query(10, gt=0, description="Количество книг на странице"),
+        cursor: str | None = Query(
+            None, description="Курсор следующей страницы (next_cursor из предыдущего ответа)")
+) -> dict[str, str | int | list[BooksResponse] | None]:
+    after = {"rank": None, "id": None}
+    if cursor:
+        try:
+            after = decode_cursor(cursor, rank=float, id=int)
+        except InvalidCursorException:
+            raise InvalidCursorHTTPException()
+    books = await db.books.search_books(
+        q=q, limit=per_page, after_rank=after["rank"], after_id=after["id"])
+    next_cursor = None
+    if books and len(books) == per_page:
+        next_cursor = encode_cursor(rank=books[-1]["rank"], id=books[-1]["id"])
+    for book in books:
+        del book["rank"]
+    return ORJSONResponse({
+        "status_code": HTTP_200,
+        "books": books,
+        "next_cursor": next_cursor
+    })
+
+
+@router.get(path="/batch",
+            summary=API_BATCH_SUMMARY,
+            description=API_BATCH_DESCRIPTION)
+async def get_books_batch(
+        db: DBDep,
+        ids: IdsDep
+) -> dict[str, str | int | list[BooksResponse] | list[int]]:
+    books, missing_ids = await db.books.get_many_by_ids(ids)
+    return {
+        "status": HTTP_200,
+        "books": books,
+        "missing_ids": missing_ids
+    }
+
+
+@router.post(path="/batch",
+             summary=API_BATCH_SUMMARY,
+             description=API_BATCH_DESCRIPTION)
+async def get_books_batch_post(
+        db: DBDep,
+        batch: BooksRequestBatch
+) -> dict[str, str | int | list[BooksResponse] | list[int]]:
+    books, missing_ids = await db.books.get_many_by_ids(batch.ids)
+    return {
+        "status": HTTP_200,
+        "books": books,
+        "missing_ids": missing_ids
+    }
+
+
 @router.get(path="/{book_id}",
             responses={
                 HTTP_200: API_RESPONSE[HTTP_200],
+                HTTP_304: API_RESPONSE[HTTP_304],
+                HTTP_400: API_RESPONSE[HTTP_400],
                 HTTP_404: API_RESPONSE[HTTP_404],
             },
             summary=API_GET_SUMMARY,
             description=API_GET_DESCRIPTION)
 async def get_book(
         db: DBDep,
-        book_id: int = Path(description="ID объекта", example="1")
+        response: Response,
+        book_id: int = Path(description="ID объекта", example="1"),
+        fields: str | None = Query(
+            None, description="Поля ответа через запятую (например, id,title). "
+                              "По умолчанию - все поля", example="id,title"),
+        if_none_match: str | None = Header(None, description="ETag из предыдущего ответа")
 ) -> dict[str, str | int | BooksResponse]:
+    try:
+        fields = parse_fields(fields, BooksResponse.model_fields)
+    except InvalidFieldsException:
+        raise InvalidFieldsHTTPException()
+    if fields is not None:
+        try:
+            book = await db.books.get_one_fields(fields, id=book_id)
+        except ObjectNotFoundException:
+            raise ObjectNotFoundHTTPException()
+        etag = projection_etag(book, fields)
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=HTTP_304, headers={"ETag": etag})
+        return ORJSONResponse({
+            "status": HTTP_200,
+            "book": project(book, fields)
+        }, headers={"ETag": etag})
     try:
         book = await db.books.get_one_by_id(id=book_id)
     except ObjectNotFoundException:
         raise ObjectNotFoundHTTPException()
+    etag = book_etag(book)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=HTTP_304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     return {
         "status": HTTP_200,
         "book": book
@@ -44,7 +194,9 @@ async def get_book(
 
 @router.get(path="",
             responses={
-                HTTP_200_LIST: API_RESPONSE[HTTP_200_LIST]
+                HTTP_200_LIST: API_RESPONSE[HTTP_200_LIST],
+                HTTP_304: API_RESPONSE[HTTP_304],
+                HTTP_400: API_RESPONSE[HTTP_400],
             },
             summary=API_GET_ALL_SUMMARY,
             description=API_GET_ALL_DESCRIPTION)
@@ -54,20 +206,77 @@ async def get_list_filtered_books(
         title: str | None = Query(None, description="Название книги"),
         date_of_writing: int | None = Query(
             None, le=CURRENT_YEAR ,description="Год написания"),
+        year_from: int | None = Query(
+            None, le=CURRENT_YEAR, description="Год написания от (включительно)"),
+        year_to: int | None = Query(
+            None, le=CURRENT_YEAR, description="Год написания до (включительно)"),
         page: int | None = Query(1, gt=0, description="Номер страницы"),
-        per_page: int | None = Query(3, description="Количество книг на странице")
-) -> dict[str, str | int | list[BooksResponse | None]]:
-    books = await db.books.get_filtered_books_list(
-        author=author,
-        title=title,
-        date_of_writing=date_of_writing,
+        per_page: int | None = Query(3, description="Количество книг на странице"),
+        cursor: str | None = Query(
+            None, description="Курсор следующей страницы (next_cursor из "
+                              "предыдущего ответа). Если передан, page игнорируется"),
+        total_mode: Literal["exact", "estimated", "none"] = Query(
+            "none", description="Подсчет общего количества книг: exact - точный "
+                                "COUNT(*), estimated - оценка по статистике "
+                                "PostgreSQL, none - без подсчета"),
+        fields: str | None = Query(
+            None, description="Поля книг через запятую (например, id,title). "
+                              "По умолчанию - все поля", example="id,title"),
+        if_none_match: str | None = Header(None, description="ETag из предыдущего ответа")
+) -> dict[str, str | int | list[BooksResponse | None] | None]:
+    after_id = None
+    if cursor:
+        try:
+            after_id = decode_cursor(cursor, id=int)["id"]
+        except InvalidCursorException:
+            raise InvalidCursorHTTPException()
+    try:
+        fields = parse_fields(fields, BooksResponse.model_fields)
+    except InvalidFieldsException:
+        raise InvalidFieldsHTTPException()
+    filters = {
+        "author": author,
+        "title": title,
+        "date_of_writing": date_of_writing,
+        "year_from": year_from,
+        "year_to": year_to,
+    }
+    get_page = db.books.get_filtered_books_rows(
+        **filters,
         limit=per_page,
-        offset=per_page * (page - 1)
+        offset=None if cursor else per_page * (page - 1),
+        after_id=after_id,
+        fields=fields
     )
-    return {
+    total = None
+    if total_mode == "exact":
+        # COUNT(*) выполняется параллельно со страницей в отдельной сессии;
+        # при ошибке одного запроса второй отменяется до закрытия сессии
+        async with db.fork() as count_db:
+            async with asyncio.TaskGroup() as group:
+                page_task = group.create_task(get_page)
+                count_task = group.create_task(count_db.books.count_filtered_books(**filters))
+            books, total = page_task.result(), count_task.result()
+    else:
+        books = await get_page
+        if total_mode == "estimated":
+            total = await db.books.estimate_filtered_books(**filters)
+    next_cursor = None
+    if books and len(books) == per_page:
+        next_cursor = encode_cursor(id=books[-1]["id"])
+    etag = list_etag(books, next_cursor, total, fields)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=HTTP_304, headers={"ETag": etag})
+    if fields is not None:
+        books = [project(book, fields) for book in books]
+    # Строки уже соответствуют BooksResponse: отдаем их напрямую через orjson,
+    # минуя повторную валидацию по аннотации (она остается для схемы OpenAPI).
+    return ORJSONResponse({
         "status_code": HTTP_200,
-        "books": books
-    }
+        "books": books,
+        "next_cursor": next_cursor,
+        "total": total
+    }, headers={"ETag": etag})
 
 
 @router.post(path="",
@@ -84,7 +293,10 @@ async def create_book(
             openapi_examples=OPENAPI_EXAMPLES)
 ) -> dict[str, str | int | BooksResponse]:
     try:
-        book = await db.books.create(book_data)
+        if settings.INSERT_BATCH_ENABLED:
+            book = await books_insert_batcher.submit(book_data)
+        else:
+            book = await db.books.create(book_data)
     except UniqueObjectException:
         raise UniqueObjectHTTPException()
     return {
@@ -93,59 +305,153 @@ async def create_book(
     }
 
 
+@router.post(path="/bulk",
+             responses=API_BULK_RESPONSE,
+             summary=API_POST_BULK_SUMMARY,
+             description=API_POST_BULK_DESCRIPTION)
+async def create_books_bulk(
+        db: DBDep,
+        books_data: list[BooksRequestAdd] = Body(min_length=1)
+) -> dict[str, str | int | list[BooksResponse] | list[BooksRequestAdd]]:
+    books, conflicts = await db.books.create_many(books_data)
+    return {
+        "status": HTTP_201,
+        "books": books,
+        "conflicts": conflicts
+    }
+
+
+@router.patch(path="/bulk",
+              responses=API_BULK_IDS_RESPONSE,
+              summary=API_PATCH_BULK_SUMMARY,
+              description=API_PATCH_BULK_DESCRIPTION)
+async def edit_books_bulk(
+        db: DBDep,
+        books_data: BooksRequestBulkPATCH
+) -> dict[str, str | int | list[int]]:
+    try:
+        if books_data.patches is not None:
+            ids = await db.books.edit_each(books_data.patches)
+        else:
+            ids = await db.books.edit_many(books_data.patch, books_data.ids)
+    except UniqueObjectException:
+        raise UniqueObjectHTTPException()
+    return {
+        "status_code": HTTP_200,
+        "ids": ids
+    }
+
+
 @router.patch(path="/{book_id}",
               responses={
                   HTTP_200: API_RESPONSE[HTTP_200],
                   HTTP_404: API_RESPONSE[HTTP_404],
                   HTTP_409: API_RESPONSE[HTTP_409],
+                  HTTP_412: API_RESPONSE[HTTP_412],
                   HTTP_422: API_RESPONSE[HTTP_422],
               },
               summary=API_PATCH_SUMMARY,
               description=API_PATCH_DESCRIPTION)
 async def partitial_edit_book(
         db: DBDep,
+        response: Response,
         book_id: int,
-        book_data: BooksRequestPATCH
+        book_data: BooksRequestPATCH,
+        if_match: str | None = Header(None, description="ETag редактируемой версии объекта")
 
 ) -> dict[str, str | int | BooksResponse]:
     try:
-        book = await db.books.edit(book_data, id=book_id, exclude_unset=True)
+        book = await db.books.edit(book_data, id=book_id, exclude_unset=True,
+                                   expected_versions=if_match_versions(if_match, book_id))
     except UniqueObjectException:
         raise UniqueObjectHTTPException()
     except ObjectNotFoundException:
         raise ObjectNotFoundHTTPException()
+    except VersionConflictException:
+        raise PreconditionFailedHTTPException()
+    response.headers["ETag"] = book_etag(book)
     return {
         "status_code": HTTP_200,
         "book": book
     }
 
 
+@router.put(path="/by-title/{title}",
+            responses={
+                HTTP_200: API_RESPONSE[HTTP_200],
+                HTTP_201: API_RESPONSE[HTTP_201],
+                HTTP_422: API_RESPONSE[HTTP_422],
+            },
+            summary=API_UPSERT_SUMMARY,
+            description=API_UPSERT_DESCRIPTION)
+async def upsert_book(
+        db: DBDep,
+        response: Response,
+        book_data: BooksRequestUpsert,
+        title: str = Path(max_length=128, description="Название книги",
+                          example="The Great Gatsby")
+) -> dict[str, str | int | bool | BooksResponse]:
+    book, inserted = await db.books.upsert(
+        BooksRequestAdd(title=title, **book_data.model_dump()))
+    response.headers["ETag"] = book_etag(book)
+    return {
+        "status_code": HTTP_201 if inserted else HTTP_200,
+        "inserted": inserted,
+        "book": book
+    }
+
+
 @router.put(path="/{book_id}",
             responses={
                 HTTP_200: API_RESPONSE[HTTP_200],
                 HTTP_404: API_RESPONSE[HTTP_404],
                 HTTP_409: API_RESPONSE[HTTP_409],
+                HTTP_412: API_RESPONSE[HTTP_412],
                 HTTP_422: API_RESPONSE[HTTP_422],
             },
             summary=API_PUT_SUMMARY,
             description=API_PUT_DESCRIPTION)
 async def full_edit_book(
         db: DBDep,
+        response: Response,
         book_data: BooksRequestPUT,
-        book_id: int = Path(description="ID объекта", example="1")
+        book_id: int = Path(description="ID объекта", example="1"),
+        if_match: str | None = Header(None, description="ETag редактируемой версии объекта")
 ) -> dict[str, str | int | BooksResponse]:
     try:
-        book = await db.books.edit(book_data, id=book_id)
+        book = await db.books.edit(book_data, id=book_id,
+                                   expected_versions=if_match_versions(if_match, book_id))
     except UniqueObjectException:
         raise UniqueObjectHTTPException()
     except ObjectNotFoundException:
         raise ObjectNotFoundHTTPException()
+    except VersionConflictException:
+        raise PreconditionFailedHTTPException()
+    response.headers["ETag"] = book_etag(book)
     return {
         "status_code": HTTP_200,
         "deleted_obj": book
     }
 
 
+@router.delete(
+    path="",
+    responses={
+        HTTP_204: API_RESPONSE[HTTP_204]},
+    summary=API_DELETE_BULK_SUMMARY,
+    description=API_DELETE_BULK_DESCRIPTION
+)
+async def delete_books_bulk(
+        db: DBDep,
+        ids: IdsDep
+) -> dict[str, str | int | list[int]]:
+    deleted_ids = await db.books.delete_many(ids)
+    return {
+        "status": HTTP_204,
+        "deleted_ids": deleted_ids
+    }
+
+
 @router.delete(
     path="/{book_id}",
     responses={
@@ -0,0 +1,22 @@
+from fastapi import APIRouter
+
+from src.config.db_config import database
+from src.constants import HTTP_200, HTTP_503, API_READY_SUMMARY, API_READY_DESCRIPTION
+from src.exceptions.exceptions import ServiceUnavailableHTTPException
+
+router = APIRouter(tags=["Служебные"])
+
+
+@router.get(path="/ready",
+            responses={
+                HTTP_503: {"description": "Service Unavailable - warm-up is not finished"},
+            },
+            summary=API_READY_SUMMARY,
+            description=API_READY_DESCRIPTION)
+async def get_readiness() -> dict[str, int | str]:
+    if not database.ready:
+        raise ServiceUnavailableHTTPException()
+    return {
+        "status_code": HTTP_200,
+        "status": "ready"
+    }
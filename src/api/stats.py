@@ -0,0 +1,35 @@
+from fastapi import APIRouter
+
+from src.config.db_config import database
+from src.config.pool_stats import pool_stats
+from src.constants import (HTTP_200, API_CACHE_STATS_SUMMARY, API_CACHE_STATS_DESCRIPTION,
+                           API_POOL_STATS_SUMMARY, API_POOL_STATS_DESCRIPTION)
+from src.repositories.books import BooksRepository
+
+router = APIRouter(prefix="/stats", tags=["Статистика"])
+
+
+@router.get(path="/cache",
+            summary=API_CACHE_STATS_SUMMARY,
+            description=API_CACHE_STATS_DESCRIPTION)
+async def get_cache_stats() -> dict[str, int | dict[str, int | float | None] | None]:
+    cache = BooksRepository.cache
+    list_cache = BooksRepository.list_cache
+    single_flight = BooksRepository.single_flight
+    return {
+        "status_code": HTTP_200,
+        "books": cache.stats() if cache is not None else None,
+        "book_lists": list_cache.stats() if list_cache is not None else None,
+        "single_flight": single_flight.stats() if single_flight is not None else None
+    }
+
+
+@router.get(path="/pool",
+            summary=API_POOL_STATS_SUMMARY,
+            description=API_POOL_STATS_DESCRIPTION)
+async def get_pool_stats() -> dict[str, int | dict[str, int | float] | list[dict[str, str | bool]]]:
+    return {
+        "status_code": HTTP_200,
+        "pool": pool_stats.snapshot(database.engine.pool),
+        "replicas": database.replica_router.snapshot()
+    }
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -13,6 +15,56 @@ class Settings(BaseSettings):
             DB_HOST: Хост БД.
             DB_PORT: Порт БД.
             DB_NAME: Имя базы данных.
+            DB_POOL_SIZE: Количество постоянных соединений в пуле.
+            DB_MAX_OVERFLOW: Количество дополнительных соединений сверх DB_POOL_SIZE.
+            DB_POOL_TIMEOUT: Время ожидания свободного соединения в секундах.
+            DB_POOL_RECYCLE: Время жизни соединения в секундах (-1 - без ограничения).
+            DB_POOL_PRE_PING: Проверять соединение перед выдачей из пула.
+            DB_STATEMENT_CACHE_SIZE: Размер кеша подготовленных выражений asyncpg
+                на одно соединение (0 - отключить, например для pgbouncer).
+            SLOW_QUERY_THRESHOLD_MS: Порог длительности SQL-запроса в миллисекундах,
+                после которого запрос попадает в журнал (None - журнал выключен).
+            SLOW_QUERY_EXPLAIN_SAMPLE_RATE: Доля медленных SELECT-запросов (0.0-1.0),
+                для которых в журнал пишется EXPLAIN (ANALYZE, BUFFERS).
+            BULK_COPY_THRESHOLD: Размер пакета, начиная с которого массовая вставка
+                выполняется через COPY вместо многострочного INSERT.
+            EXPORT_FETCH_SIZE: Количество строк, выбираемых из серверного курсора
+                за один раз при потоковой выгрузке каталога.
+            ITEM_CACHE_ENABLED: Включает кеш одиночных объектов в памяти процесса.
+                Кеш у каждого воркера свой: запись через другой воркер не сбрасывает
+                его, и до истечения ITEM_CACHE_TTL воркер может отдавать прежнюю версию.
+            ITEM_CACHE_MAX_SIZE: Максимальное количество объектов в кеше.
+            ITEM_CACHE_TTL: Время жизни объекта в кеше в секундах.
+            LIST_CACHE_BACKEND: Хранилище кеша списочных запросов: memory - в памяти
+                процесса, redis - общий Redis для всех воркеров, none - кеш выключен.
+            LIST_CACHE_MAX_SIZE: Максимальное количество результатов в кеше в памяти.
+            LIST_CACHE_TTL: Время жизни результата в кеше списков в секундах.
+            REDIS_URL: URL Redis для LIST_CACHE_BACKEND=redis (redis://host:6379/0).
+            INSERT_BATCH_ENABLED: Собирать одиночные создания книг (POST /books)
+                в пакеты, записываемые одной транзакцией.
+            INSERT_BATCH_WINDOW_MS: Время сбора пакета в миллисекундах.
+            INSERT_BATCH_MAX_SIZE: Размер пакета, при котором он записывается сразу.
+            SINGLE_FLIGHT_ENABLED: Объединять одновременные одинаковые чтения
+                в один запрос к БД.
+            DB_REPLICA_URLS: DSN реплик для читающих запросов в формате
+                postgresql+asyncpg://... (JSON-список; пустой - читать с основной БД).
+            DB_REPLICA_CHECK_INTERVAL: Период проверки доступности реплик в секундах.
+            DB_REPLICA_CHECK_TIMEOUT: Таймаут одной проверки реплики в секундах.
+            DB_REPLICA_MAX_LAG: Допустимое отставание реплик в секундах: реплика, отставшая
+                больше, не получает чтений; столько же времени после записи в таблицу
+                результаты чтения ее с реплик не сохраняются в кеш списков.
+            DB_WARMUP_CONNECTIONS: Количество соединений, которые открываются и прогреваются
+                при старте воркера (None - DB_POOL_SIZE, 0 - без прогрева).
+            DB_WARMUP_TIMEOUT: Сколько секунд старт воркера ждет прогрева; если он не
+                успел, воркер запускается неготовым и прогрев продолжается в фоне.
+            DB_WARMUP_RETRY_INTERVAL: Пауза между попытками прогрева в секундах.
+            SERVER_HOST: Адрес, на котором production-запуск принимает соединения.
+            SERVER_PORT: Порт production-запуска.
+            SERVER_WORKERS: Количество процессов-воркеров (None - по числу ядер CPU).
+            SERVER_GRACEFUL_SHUTDOWN_TIMEOUT: Время в секундах, которое воркер при остановке
+                ждет завершения текущих запросов перед закрытием соединений.
+            SERVER_KEEPALIVE_TIMEOUT: Время в секундах, в течение которого держится
+                простаивающее keep-alive соединение.
     """
     DB_USER: str | None = None
     DB_PASS: str | None = None
@@ -20,6 +72,49 @@ class Settings(BaseSettings):
     DB_PORT: int | None = None
     DB_NAME: str | None = None
 
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = -1
+    DB_POOL_PRE_PING: bool = False
+    DB_STATEMENT_CACHE_SIZE: int = 100
+
+    SLOW_QUERY_THRESHOLD_MS: float | None = None
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = 0.0
+
+    BULK_COPY_THRESHOLD: int = 1000
+    EXPORT_FETCH_SIZE: int = 1000
+
+    ITEM_CACHE_ENABLED: bool = False
+    ITEM_CACHE_MAX_SIZE: int = 10000
+    ITEM_CACHE_TTL: float = 60
+
+    LIST_CACHE_BACKEND: Literal["memory", "redis", "none"] = "none"
+    LIST_CACHE_MAX_SIZE: int = 1000
+    LIST_CACHE_TTL: float = 30
+    REDIS_URL: str | None = None
+
+    INSERT_BATCH_ENABLED: bool = False
+    INSERT_BATCH_WINDOW_MS: float = 5
+    INSERT_BATCH_MAX_SIZE: int = 100
+
+    SINGLE_FLIGHT_ENABLED: bool = True
+
+    DB_REPLICA_URLS: list[str] = []
+    DB_REPLICA_CHECK_INTERVAL: float = 5
+    DB_REPLICA_CHECK_TIMEOUT: float = 1
+    DB_REPLICA_MAX_LAG: float = 1
+
+    DB_WARMUP_CONNECTIONS: int | None = None
+    DB_WARMUP_TIMEOUT: float = 30
+    DB_WARMUP_RETRY_INTERVAL: float = 2
+
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int | None = None
+    SERVER_GRACEFUL_SHUTDOWN_TIMEOUT: float = 30
+    SERVER_KEEPALIVE_TIMEOUT: int = 5
+
     model_config = SettingsConfigDict(env_file=".env")
 
     @property
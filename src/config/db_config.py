@@ -2,9 +2,81 @@ from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, declared_attr
 
 from src.config.config import settings
+from src.config.pool_stats import InstrumentedPool
+from src.config.replicas import ReplicaRouter
+from src.monitoring.metrics import instrument_engine
+from src.monitoring.slow_queries import instrument_slow_queries
 
-engine = create_async_engine(url=settings.DB_URL)
-async_session = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+
+def make_engine(url: str, **kwargs):
+    """Создает асинхронный движок с настройками пула из Settings и подключает мониторинг.
+
+            Args:
+                url (str): DSN базы данных.
+                **kwargs: Дополнительные аргументы create_async_engine (например, poolclass).
+    """
+    engine = create_async_engine(
+        url=url,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args={
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        },
+        **kwargs,
+    )
+    instrument_engine(engine)
+    instrument_slow_queries(engine)
+    return engine
+
+
+class Database:
+    """Движки и фабрики сессий БД одного процесса приложения.
+
+        Создаются в lifespan приложения (`connect`) и закрываются при его
+        остановке (`disconnect`), а не при импорте модуля: каждый воркер
+        uvicorn открывает собственный пул соединений и не наследует
+        соединения родительского процесса.
+
+        Attributes:
+            engine: Движок основной БД (None до вызова connect).
+            session_factory: Фабрика сессий основной БД.
+            replica_router: Маршрутизатор читающих запросов по репликам.
+            ready (bool): Завершен ли прогрев пула (см. src.config.warmup).
+    """
+
+    def __init__(self):
+        self.engine = None
+        self.session_factory = None
+        self.replica_router = None
+        self.ready = False
+
+    def connect(self):
+        """Создает движки основной БД и реплик. Соединения открываются по требованию."""
+        self.engine = make_engine(settings.DB_URL, poolclass=InstrumentedPool)
+        self.session_factory = async_sessionmaker(bind=self.engine, expire_on_commit=False)
+        self.replica_router = ReplicaRouter(
+            [make_engine(url) for url in settings.DB_REPLICA_URLS],
+            check_interval=settings.DB_REPLICA_CHECK_INTERVAL,
+            check_timeout=settings.DB_REPLICA_CHECK_TIMEOUT,
+            max_lag=settings.DB_REPLICA_MAX_LAG,
+        )
+
+    async def disconnect(self):
+        """Закрывает соединения пулов основной БД и реплик."""
+        if self.replica_router is not None:
+            await self.replica_router.dispose()
+        if self.engine is not None:
+            await self.engine.dispose()
+        self.engine = self.session_factory = self.replica_router = None
+        self.ready = False
+
+
+database = Database()
 
 
 class Base(DeclarativeBase):
@@ -8,40 +8,95 @@ class DBManager:
         Реализует контекстный менеджер через __aenter__/__aexit__ для автоматического
         управления жизненным циклом сессии.
 
+        Сессия и репозитории создаются лениво - при первом обращении, поэтому
+        запросы, которые не дошли до БД (ответ из кеша, ошибка валидации),
+        не открывают сессию и не берут соединение из пула.
+
+        Читающие методы репозиториев работают через отдельную сессию `read_session`,
+        которая при заданной фабрике реплики открывается на реплике, а без нее
+        совпадает с основной сессией.
+
         Attributes:
             session_factory: Фабрика для создания асинхронных сессий SQLAlchemy.
-            session: Текущая активная сессия БД.
-            books: Репозиторий для работы с книгами.
+            read_session_factory: Фабрика сессий реплики для чтения (None - основная БД).
+            read_your_writes (bool): Запрос требует видеть все записи (X-Read-Your-Writes):
+                репозитории не берут объекты из кеша процесса.
+            session: Текущая сессия БД (создается при первом обращении).
+            read_session: Сессия для чтения (создается при первом обращении).
+            books: Репозиторий для работы с книгами (создается при первом обращении).
     """
 
-    def __init__(self, session_factory):
+    def __init__(self, session_factory, read_session_factory=None, read_your_writes=False):
         """Инициализирует менеджер с фабрикой сессий.
 
                 Args:
                     session_factory: Callable, создающий новый экземпляр AsyncSession.
+                    read_session_factory: Callable, создающий сессию реплики для чтения.
+                    read_your_writes (bool): Не читать объекты из кеша процесса.
         """
         self.session_factory = session_factory
+        self.read_session_factory = read_session_factory
+        self.read_your_writes = read_your_writes
+        self._session = None
+        self._read_session = None
+        self._books = None
 
-    async def __aenter__(self):
-        """Вход в контекстный менеджер. Создает сессию и инициализирует репозитории.
+    @property
+    def session(self):
+        """Текущая сессия БД. Создается при первом обращении."""
+        if self._session is None:
+            self._session = self.session_factory()
+        return self._session
+
+    @property
+    def read_session(self):
+        """Сессия для чтения. Создается при первом обращении."""
+        if self.read_session_factory is None:
+            return self.session
+        if self._read_session is None:
+            self._read_session = self.read_session_factory()
+        return self._read_session
+
+    @property
+    def books(self) -> BooksRepository:
+        """Репозиторий для работы с книгами. Создается при первом обращении."""
+        if self._books is None:
+            self._books = BooksRepository(self.session, self.read_session,
+                                          read_your_writes=self.read_your_writes)
+        return self._books
+
+    def fork(self) -> "DBManager":
+        """Создает независимый менеджер с собственной сессией на той же фабрике.
+
+                Нужен для параллельных запросов в рамках одного HTTP-запроса:
+                одна сессия не может выполнять несколько запросов одновременно.
 
                 Returns:
-                    self: Экземпляр DBManager с активной сессией.
+                    DBManager: Новый менеджер, который нужно использовать как контекстный.
         """
-        self.session = self.session_factory()
+        return DBManager(self.session_factory, self.read_session_factory, self.read_your_writes)
 
-        self.books = BooksRepository(self.session)
+    async def __aenter__(self):
+        """Вход в контекстный менеджер.
 
+                Returns:
+                    self: Экземпляр DBManager. Сессия будет открыта при первом обращении.
+        """
         return self
 
     async def __aexit__(self, *args):
-        """Выход из контекстного менеджера. Откатывает и закрывает сессию.
+        """Выход из контекстного менеджера. Откатывает незавершенную транзакцию и
+        закрывает сессию, если она была открыта.
 
                 Args:
                     *args: Аргументы исключения (type, value, traceback), если оно возникло.
         """
-        await self.session.rollback()
-        await self.session.close()
+        for session in (self._session, self._read_session):
+            if session is None:
+                continue
+            if session.in_transaction():
+                await session.rollback()
+            await session.close()
 
     async def commit(self):
         """Фиксирует текущую транзакцию в БД.
@@ -49,4 +104,5 @@ class DBManager:
                 Raises:
                     SQLAlchemyError: При ошибках во время коммита.
         """
-        self.session.commit()
+        if self._session is not None:
+            await self._session.commit()
@@ -0,0 +1,71 @@
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class PoolStats:
+    """Накопительные счетчики выдачи соединений из пула.
+
+        Attributes:
+            checkouts: Количество выданных соединений.
+            timeouts: Количество запросов соединения, завершившихся по pool_timeout.
+            wait_time_total: Суммарное время ожидания соединения в секундах.
+            wait_time_max: Максимальное время ожидания соединения в секундах.
+    """
+
+    def __init__(self):
+        """Инициализирует счетчики нулями."""
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def record_checkout(self, wait_time: float):
+        """Учитывает успешную выдачу соединения и время ее ожидания."""
+        self.checkouts += 1
+        self.wait_time_total += wait_time
+        self.wait_time_max = max(self.wait_time_max, wait_time)
+
+    def snapshot(self, pool) -> dict[str, int | float]:
+        """Возвращает текущее состояние пула вместе с накопленными счетчиками.
+
+                Args:
+                    pool: Пул соединений движка (`engine.pool`).
+
+                Returns:
+                    dict: Размер пула, занятые/свободные/overflow-соединения,
+                        количество выдач и таймаутов, время ожидания соединения.
+        """
+        return {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_time_total": self.wait_time_total,
+            "wait_time_avg": self.wait_time_total / self.checkouts if self.checkouts else 0.0,
+            "wait_time_max": self.wait_time_max,
+        }
+
+
+pool_stats = PoolStats()
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Пул соединений, измеряющий время ожидания соединения и таймауты.
+
+       Время ожидания включает открытие нового overflow-соединения, если
+       свободных соединений в пуле нет.
+    """
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            pool_stats.timeouts += 1
+            raise
+        pool_stats.record_checkout(time.perf_counter() - start)
+        return connection
@@ -0,0 +1,126 @@
+import asyncio
+import itertools
+import logging
+import time
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+# Отставание реплики в секундах: 0, если это не standby или все полученные
+# изменения уже применены (иначе простаивающая основная БД выглядела бы
+# отставшей), и NULL, если standby еще ничего не применил.
+REPLICA_LAG_QUERY = text(
+    "SELECT CASE WHEN NOT pg_is_in_recovery() "
+    "OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE extract(epoch FROM now() - pg_last_xact_replay_timestamp()) END"
+)
+
+
+class Replica:
+    """Реплика БД: движок, фабрика сессий и результат последней проверки.
+
+        Attributes:
+            engine: Асинхронный движок SQLAlchemy реплики.
+            session_factory: Фабрика сессий, привязанная к движку реплики.
+            healthy (bool): Прошла ли реплика последнюю проверку.
+            checked_at (float | None): Время последней проверки (time.monotonic).
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+        self.healthy = False
+        self.checked_at = None
+
+
+class ReplicaRouter:
+    """Выбирает реплику для читающих запросов с проверкой доступности.
+
+        Реплики выбираются по кругу среди прошедших последнюю проверку.
+        Проверка (запрос отставания реплики с таймаутом) запускается в фоне,
+        когда результат предыдущей устарел, поэтому запрос, вызвавший выбор
+        реплики, ее не ждет. Реплика, отставшая больше чем на `max_lag` секунд,
+        считается недоступной. До первой успешной проверки и при недоступности
+        всех реплик чтение идет на основную БД.
+
+        Attributes:
+            replicas (list[Replica]): Настроенные реплики.
+            check_interval (float): Период проверки реплик в секундах.
+            check_timeout (float): Таймаут одной проверки в секундах.
+            max_lag (float): Допустимое отставание реплики в секундах.
+    """
+
+    def __init__(self, engines, check_interval: float, check_timeout: float, max_lag: float):
+        self.replicas = [Replica(engine) for engine in engines]
+        self.check_interval = check_interval
+        self.check_timeout = check_timeout
+        self.max_lag = max_lag
+        self._counter = itertools.count()
+        self._refresh_task = None
+
+    def pick(self):
+        """Возвращает фабрику сессий доступной реплики.
+
+                Returns:
+                    async_sessionmaker | None: Фабрика сессий реплики или None,
+                        если читать нужно с основной БД.
+        """
+        if not self.replicas:
+            return None
+        self._schedule_refresh()
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        return healthy[next(self._counter) % len(healthy)].session_factory
+
+    def _schedule_refresh(self):
+        """Запускает фоновую проверку реплик, если предыдущая устарела."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        now = time.monotonic()
+        if all(replica.checked_at is not None
+               and now - replica.checked_at < self.check_interval
+               for replica in self.replicas):
+            return
+        self._refresh_task = asyncio.create_task(self.refresh())
+
+    async def refresh(self):
+        """Проверяет все реплики параллельно и обновляет их статус."""
+        await asyncio.gather(*(self._check(replica) for replica in self.replicas))
+
+    async def _check(self, replica: Replica):
+        """Проверяет доступность и отставание реплики и обновляет ее статус."""
+        try:
+            async with asyncio.timeout(self.check_timeout):
+                async with replica.engine.connect() as connection:
+                    lag = (await connection.execute(REPLICA_LAG_QUERY)).scalar_one()
+        except (OSError, SQLAlchemyError, TimeoutError) as ex:
+            healthy = False
+            if replica.healthy or replica.checked_at is None:
+                logger.warning("Read replica %s is unavailable: %r",
+                               replica.engine.url.render_as_string(hide_password=True), ex)
+        else:
+            healthy = lag is not None and lag <= self.max_lag
+            if not healthy and (replica.healthy or replica.checked_at is None):
+                logger.warning("Read replica %s lags behind by %s s, reading from the primary",
+                               replica.engine.url.render_as_string(hide_password=True), lag)
+        replica.healthy = healthy
+        replica.checked_at = time.monotonic()
+
+    async def dispose(self):
+        """Останавливает фоновую проверку и закрывает соединения реплик."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def snapshot(self) -> list[dict[str, str | bool]]:
+        """Возвращает статус реплик для эндпоинта статистики."""
+        return [
+            {"url": replica.engine.url.render_as_string(hide_password=True),
+             "healthy": replica.healthy}
+            for replica in self.replicas
+        ]
@@ -0,0 +1,75 @@
+import asyncio
+import logging
+import uuid
+from contextlib import suppress
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.exceptions.exceptions import ObjectNotFoundException, UniqueObjectException
+from src.repositories.books import BooksRepository
+from src.schemas.books import BooksRequestAdd, BooksRequestPUT
+
+logger = logging.getLogger(__name__)
+
+
+async def _warm_up_connection(engine):
+    """Выполняет горячие запросы репозитория на одном соединении и откатывает их.
+
+        Запросы строятся теми же методами репозитория, что и в обработчиках,
+        поэтому в кеш компиляции SQLAlchemy и в кеш подготовленных выражений
+        asyncpg этого соединения попадают те же тексты SQL. Сессия работает
+        внутри внешней транзакции через SAVEPOINT, и после прогрева она
+        откатывается целиком: записи и кеши приложения не затрагиваются.
+        Объединение чтений отключено, чтобы запросы выполнились на каждом соединении.
+    """
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        session = AsyncSession(bind=connection, join_transaction_mode="create_savepoint",
+                               expire_on_commit=False)
+        books = BooksRepository(session)
+        books.cache = None
+        books.list_cache = None
+        books.single_flight = None
+        try:
+            filters = {"author": None, "title": None, "date_of_writing": None}
+            await books.get_filtered_books_rows(**filters, limit=3, offset=0)
+            await books.get_filtered_books_rows(**filters, limit=3, offset=3)
+            await books.count_filtered_books(**filters)
+            with suppress(ObjectNotFoundException):
+                await books.get_one_by_id(id=0)
+            with suppress(ObjectNotFoundException):
+                await books.edit(BooksRequestPUT(title="", author="", date_of_writing=0), id=0)
+            with suppress(ObjectNotFoundException):
+                await books.delete(id=0)
+            with suppress(UniqueObjectException):
+                await books.create(BooksRequestAdd(title=f"warm-up {uuid.uuid4()}", author="warm-up"))
+        finally:
+            await session.close()
+            await transaction.rollback()
+
+
+async def warm_up(database, connections: int, retry_interval: float):
+    """Прогревает пул соединений основной БД и помечает базу готовой.
+
+        Открывает одновременно `connections` соединений и на каждом выполняет
+        горячие запросы (см. _warm_up_connection); после возврата в пул
+        соединения остаются открытыми. При ошибке прогрев повторяется
+        каждые `retry_interval` секунд, пока не пройдет.
+
+        Args:
+            database (Database): Подключенный holder движков; по завершении
+                у него выставляется `ready = True`.
+            connections (int): Количество соединений для прогрева.
+            retry_interval (float): Пауза между попытками в секундах.
+    """
+    while True:
+        try:
+            await asyncio.gather(*(_warm_up_connection(database.engine)
+                                   for _ in range(connections)))
+        except (OSError, SQLAlchemyError) as ex:
+            logger.warning("Database warm-up failed, retrying in %.1f s: %r", retry_interval, ex)
+            await asyncio.sleep(retry_interval)
+        else:
+            database.ready = True
+            return
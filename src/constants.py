@@ -6,10 +6,14 @@ from fastapi.openapi.models import Example
 HTTP_200 = status.HTTP_200_OK
 HTTP_201 = status.HTTP_201_CREATED
 HTTP_204 = status.HTTP_204_NO_CONTENT
+HTTP_304 = status.HTTP_304_NOT_MODIFIED
+HTTP_400 = status.HTTP_400_BAD_REQUEST
 HTTP_404 = status.HTTP_404_NOT_FOUND
 HTTP_409 = status.HTTP_409_CONFLICT
+HTTP_412 = status.HTTP_412_PRECONDITION_FAILED
 HTTP_422 = status.HTTP_422_UNPROCESSABLE_ENTITY
 HTTP_500 = status.HTTP_500_INTERNAL_SERVER_ERROR
+HTTP_503 = status.HTTP_503_SERVICE_UNAVAILABLE
 HTTP_200_LIST = status.HTTP_200_OK
 
 API_RESPONSE = {
@@ -23,7 +27,8 @@ API_RESPONSE = {
                         "id": 1,
                         "title": "Example Book",
                         "author": "Author Name",
-                        "date_of_writing": 2023
+                        "date_of_writing": 2023,
+                        "version": 1
                     }
                 }
             }
@@ -39,18 +44,23 @@ API_RESPONSE = {
                         {"id": 1,
                          "title": "Example Book",
                          "author": "Author Name",
-                         "date_of_writing": 1988},
+                         "date_of_writing": 1988,
+                         "version": 1},
 
                         {"id": 4,
                          "title": "Example Book",
                          "author": "Author Name",
-                         "date_of_writing": 2012},
+                         "date_of_writing": 2012,
+                         "version": 1},
 
                         {"id": 7,
                          "title": "Example Book",
                          "author": "Author Name",
-                         "date_of_writing": 2023},
-                    ]
+                         "date_of_writing": 2023,
+                         "version": 1},
+                    ],
+                    "next_cursor": "eyJpZCI6N30",
+                    "total": 42
                 }
             }
         }
@@ -66,6 +76,7 @@ API_RESPONSE = {
                         "title": "The Great Gatsby",
                         "author": "F. Scott Fitzgerald",
                         "date_of_writing": 1925,
+                        "version": 1,
                     }
                 }
             }
@@ -87,6 +98,19 @@ API_RESPONSE = {
             }
         }
     },
+    HTTP_400: {
+        "description": "Bad Request - Invalid pagination cursor or unknown field in fields",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": {
+                        "status_code": 400,
+                        "message": "Invalid pagination cursor"
+                    }
+                }
+            }
+        }
+    },
     HTTP_404: {
         "description": "Not Found",
         "content": {
@@ -115,6 +139,22 @@ API_RESPONSE = {
             }
         }
     },
+    HTTP_304: {
+        "description": "Not Modified - ETag matches If-None-Match",
+    },
+    HTTP_412: {
+        "description": "Precondition Failed - If-Match does not match current version",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": {
+                        "status_code": 412,
+                        "message": "Object was modified by another request"
+                    }
+                }
+            }
+        }
+    },
     HTTP_422: {
         "description": "Validation Error - Invalid input data",
         "content": {
@@ -139,6 +179,47 @@ API_RESPONSE = {
     },
 }
 
+API_BULK_IDS_RESPONSE = {
+    HTTP_200: {
+        "description": "Objects successfully changed",
+        "content": {
+            "application/json": {
+                "example": {
+                    "status_code": 200,
+                    "ids": [1, 2, 3]
+                }
+            }
+        }
+    },
+    HTTP_409: API_RESPONSE[HTTP_409],
+    HTTP_422: API_RESPONSE[HTTP_422],
+}
+
+API_BULK_RESPONSE = {
+    HTTP_201: {
+        "description": "Books successfully created, duplicates skipped",
+        "content": {
+            "application/json": {
+                "example": {
+                    "status_code": 201,
+                    "books": [
+                        {"id": 1,
+                         "title": "The Great Gatsby",
+                         "author": "F. Scott Fitzgerald",
+                         "date_of_writing": 1925,
+                         "version": 1},
+                    ],
+                    "conflicts": [
+                        {"title": "Example Book",
+                         "author": "Author Name",
+                         "date_of_writing": 2023},
+                    ]
+                }
+            }
+        }
+    },
+}
+
 OPENAPI_EXAMPLES = openapi_examples = {
             "Example 1": Example(
                 summary="Пример №1",
@@ -171,10 +252,39 @@ API_GET_SUMMARY = "Получение объекта"
 
 
 API_GET_ALL_DESCRIPTION = ("<h2>Эндпоинт для получения всех "
-                           "объектов модели Book из БД.</h2>")
+                           "объектов модели Book из БД.</h2>\n"
+                           "Поддерживает два режима пагинации:\n"
+                           "- page/per_page - постраничный (смещение);\n"
+                           "- cursor/per_page - курсорный, для перехода на "
+                           "следующую страницу передайте next_cursor из "
+                           "предыдущего ответа.\n"
+                           "Общее количество книг (total) возвращается при "
+                           "total_mode=exact или total_mode=estimated.")
 API_GET_ALL_SUMMARY = "Получение всех объектов"
 
 
+API_EXPORT_DESCRIPTION = ("<h2>Эндпоинт для потоковой выгрузки всех "
+                          "объектов модели Book из БД в формате NDJSON или CSV.</h2>")
+API_EXPORT_SUMMARY = "Выгрузка каталога"
+
+
+API_SEARCH_DESCRIPTION = ("<h2>Эндпоинт для полнотекстового поиска "
+                          "объектов модели Book по названию и автору.</h2>\n"
+                          "Результаты отсортированы по релевантности, для перехода "
+                          "на следующую страницу передайте next_cursor из "
+                          "предыдущего ответа.")
+API_SEARCH_SUMMARY = "Поиск объектов"
+
+
+API_BATCH_DESCRIPTION = ("<h2>Эндпоинт для получения нескольких объектов "
+                         "модели Book по списку ID одним запросом к БД.</h2>\n"
+                         "Книги возвращаются в порядке ID в запросе, "
+                         "ненайденные ID перечисляются в поле missing_ids. "
+                         "Для длинных списков используйте POST /books/batch.")
+API_BATCH_SUMMARY = "Получение объектов по списку ID"
+BATCH_MAX_IDS = 1000
+
+
 API_POST_DESCRIPTION = ("<h2>Эндпоинт для создания "
                         "объекта модели Book в БД по трем полям в теле запроса: \n"
                         "- title,\n"
@@ -183,6 +293,29 @@ API_POST_DESCRIPTION = ("<h2>Эндпоинт для создания "
 API_POST_SUMMARY = "Создание объекта"
 
 
+API_POST_BULK_DESCRIPTION = ("<h2>Эндпоинт для массового создания "
+                             "объектов модели Book в БД одной транзакцией.</h2>\n"
+                             "Книги с уже существующим названием не создаются "
+                             "и возвращаются в поле conflicts.")
+API_POST_BULK_SUMMARY = "Массовое создание объектов"
+
+
+API_UPSERT_DESCRIPTION = ("<h2>Эндпоинт для создания или обновления "
+                          "объекта модели Book по названию.</h2>\n"
+                          "Если книги с таким названием нет, она создается, иначе "
+                          "обновляются автор и дата написания. Поле inserted "
+                          "показывает, была ли книга создана.")
+API_UPSERT_SUMMARY = "Создание или обновление объекта по названию"
+
+
+API_PATCH_BULK_DESCRIPTION = ("<h2>Эндпоинт для массового частичного изменения "
+                              "объектов модели Book в БД одной транзакцией.</h2>\n"
+                              "Принимает либо общий набор изменений patch для списка ids, "
+                              "либо список patches с индивидуальными изменениями "
+                              "для каждого id. Возвращает ID измененных объектов.")
+API_PATCH_BULK_SUMMARY = "Массовое частичное редактирование объектов"
+
+
 API_PATCH_DESCRIPTION = ("<h2>Эндпоинт для частичного изменения "
                          "объекта модели Book в БД по ID.</h2>")
 API_PATCH_SUMMARY = "Частичное редактирование объекта"
@@ -198,4 +331,34 @@ API_DELETE_DESCRIPTION = ("<h2>Эндпоинт для безвозвратно
 API_DELETE_SUMMARY = "Удаление объекта"
 
 
+API_DELETE_BULK_DESCRIPTION = ("<h2>Эндпоинт для безвозвратного "
+                               "удаления объектов модели Book из БД по списку ID "
+                               "одной транзакцией.</h2>\n"
+                               "Возвращает ID фактически удаленных объектов.")
+API_DELETE_BULK_SUMMARY = "Массовое удаление объектов"
+
+
+API_CACHE_STATS_DESCRIPTION = ("<h2>Эндпоинт для получения счетчиков кеша "
+                               "объектов модели Book: попадания, промахи, "
+                               "вытеснения.</h2>\n"
+                               "В поле book_lists - счетчики кеша списочных запросов, "
+                               "в single_flight - объединенные одновременные чтения.\n"
+                               "Если кеш выключен, возвращается null.")
+API_CACHE_STATS_SUMMARY = "Статистика кеша"
+
+
+API_READY_DESCRIPTION = ("<h2>Эндпоинт проверки готовности воркера для балансировщика.</h2>\n"
+                         "Возвращает 200 после прогрева пула соединений с БД "
+                         "и 503 до его завершения.")
+API_READY_SUMMARY = "Готовность к приему трафика"
+
+
+API_POOL_STATS_DESCRIPTION = ("<h2>Эндпоинт для получения состояния пула "
+                              "соединений с БД: занятые и overflow-соединения, "
+                              "время ожидания соединения и таймауты.</h2>\n"
+                              "В поле replicas - реплики для чтения и результат "
+                              "их последней проверки.")
+API_POOL_STATS_SUMMARY = "Статистика пула соединений"
+
+
 CURRENT_YEAR = datetime.now().year
\ No newline at end of file
@@ -1,12 +1,19 @@
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Query, Header
+from fastapi.exceptions import RequestValidationError
 
-from src.config.db_config import async_session
+from src.config.config import settings
+from src.config.db_config import database
 from src.config.db_context_manager import DBManager
+from src.constants import BATCH_MAX_IDS
+from src.repositories.insert_batcher import InsertBatcher
 
 
-async def get_db():
+async def get_db(
+        x_read_your_writes: bool = Header(
+            False, description="Читать с основной БД, а не с реплики")
+):
     """Асинхронный генератор для внедрения зависимостей (Dependency Injection) сессии БД.
 
         Используется как зависимость в FastAPI для предоставления сессии базы данных
@@ -26,9 +33,63 @@ async def get_db():
         Примечания:
             - Автоматически закрывает сессию после завершения работы обработчика
             - Не требует ручного вызова commit()/rollback() - это делается в __aexit__ DBManager
+            - Читающие запросы идут на доступную реплику, если они настроены;
+              заголовок `X-Read-Your-Writes: true` оставляет чтение на основной БД
+              и в обход кеша объектов
     """
-    async with DBManager(session_factory=async_session) as db:
+    read_session_factory = None if x_read_your_writes else database.replica_router.pick()
+    async with DBManager(session_factory=database.session_factory,
+                         read_session_factory=read_session_factory,
+                         read_your_writes=x_read_your_writes) as db:
         yield db
 
 
 DBDep = Annotated[DBManager, Depends(get_db)]
+
+
+async def create_books_batch(books_data):
+    """Создает пакет книг в отдельной сессии для InsertBatcher.
+
+        Пакет всегда вставляется многострочным INSERT, даже если
+        INSERT_BATCH_MAX_SIZE не меньше BULK_COPY_THRESHOLD: COPY с временной
+        таблицей рассчитан на массовую загрузку, а не на частые небольшие пакеты.
+
+        Returns:
+            tuple: Созданные книги и конфликтующие данные (см. BaseRepository.create_many).
+    """
+    async with DBManager(session_factory=database.session_factory) as db:
+        return await db.books.create_many(books_data, use_copy=False)
+
+
+books_insert_batcher = InsertBatcher(create_books_batch,
+                                     window=settings.INSERT_BATCH_WINDOW_MS / 1000,
+                                     max_size=settings.INSERT_BATCH_MAX_SIZE)
+
+
+def get_ids(
+        ids: str = Query(pattern=r"^\d+(,\d+)*$",
+                         description="ID объектов через запятую", example="1,2,3")
+) -> list[int]:
+    """Разбирает список ID из параметра запроса вида `?ids=1,2,3`.
+
+        Returns:
+            list[int]: ID в порядке их перечисления в запросе.
+
+        Raises:
+            RequestValidationError: Если передано больше BATCH_MAX_IDS ID (ответ 422).
+    """
+    parsed = [int(id) for id in ids.split(",")]
+    if len(parsed) > BATCH_MAX_IDS:
+        raise RequestValidationError([{
+            "type": "too_long",
+            "loc": ("query", "ids"),
+            "msg": f"List should have at most {BATCH_MAX_IDS} items after validation, "
+                   f"not {len(parsed)}",
+            "input": ids,
+            "ctx": {"field_type": "List", "max_length": BATCH_MAX_IDS,
+                    "actual_length": len(parsed)},
+        }])
+    return parsed
+
+
+IdsDep = Annotated[list[int], Depends(get_ids)]
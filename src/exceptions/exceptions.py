@@ -1,6 +1,6 @@
 from fastapi import HTTPException
 
-from src.constants import HTTP_404, HTTP_409, HTTP_500
+from src.constants import HTTP_400, HTTP_404, HTTP_409, HTTP_412, HTTP_500, HTTP_503
 
 
 class MyBaseException(Exception):
@@ -34,6 +34,36 @@ class UniqueObjectException(MyBaseException):
     detail = "Error object create"
 
 
+class InvalidFieldsException(MyBaseException):
+    """Исключение: в параметре fields запрошено неизвестное поле.
+
+        Attributes:
+            detail (str): Сообщение об ошибке ("Unknown field requested").
+    """
+
+    detail = "Unknown field requested"
+
+
+class VersionConflictException(MyBaseException):
+    """Исключение: версия объекта не совпадает с ожидаемой (If-Match).
+
+        Attributes:
+            detail (str): Сообщение об ошибке ("Error object version mismatch").
+    """
+
+    detail = "Error object version mismatch"
+
+
+class InvalidCursorException(MyBaseException):
+    """Исключение: курсор пагинации поврежден или имеет неверный формат.
+
+        Attributes:
+            detail (str): Сообщение об ошибке ("Error invalid cursor").
+    """
+
+    detail = "Error invalid cursor"
+
+
 class MyBaseHTTPException(HTTPException):
     """Базовое HTTP-исключение для FastAPI.
 
@@ -85,3 +115,71 @@ class UniqueObjectHTTPException(MyBaseHTTPException):
         "message": "Book with this title already exists",
         "conflicting_field": "title"
     }
+
+
+class InvalidCursorHTTPException(MyBaseHTTPException):
+    """HTTP-исключение: неверный курсор пагинации (400).
+
+        Attributes:
+            status_code (int): HTTP-статус код (400).
+            detail (dict): Детали ошибки в формате JSON:
+                - status_code (int): 400
+                - message (str): "Invalid pagination cursor"
+    """
+
+    status_code = HTTP_400
+    detail = {
+        "status_code": status_code,
+        "message": "Invalid pagination cursor"
+    }
+
+
+class InvalidFieldsHTTPException(MyBaseHTTPException):
+    """HTTP-исключение: неизвестное поле в параметре fields (400).
+
+        Attributes:
+            status_code (int): HTTP-статус код (400).
+            detail (dict): Детали ошибки в формате JSON:
+                - status_code (int): 400
+                - message (str): "Unknown field requested"
+    """
+
+    status_code = HTTP_400
+    detail = {
+        "status_code": status_code,
+        "message": "Unknown field requested"
+    }
+
+
+class PreconditionFailedHTTPException(MyBaseHTTPException):
+    """HTTP-исключение: объект изменен другим запросом (412).
+
+        Attributes:
+            status_code (int): HTTP-статус код (412).
+            detail (dict): Детали ошибки в формате JSON:
+                - status_code (int): 412
+                - message (str): "Object was modified by another request"
+    """
+
+    status_code = HTTP_412
+    detail = {
+        "status_code": status_code,
+        "message": "Object was modified by another request"
+    }
+
+
+class ServiceUnavailableHTTPException(MyBaseHTTPException):
+    """HTTP-исключение: воркер еще не готов принимать трафик (503).
+
+        Attributes:
+            status_code (int): HTTP-статус код (503).
+            detail (dict): Детали ошибки в формате JSON:
+                - status_code (int): 503
+                - message (str): "Service is warming up"
+    """
+
+    status_code = HTTP_503
+    detail = {
+        "status_code": status_code,
+        "message": "Service is warming up"
+    }
@@ -1,4 +1,7 @@
+import asyncio
+import logging
 import sys
+from contextlib import asynccontextmanager
 
 import uvicorn
 from pathlib import Path
@@ -8,9 +11,44 @@ from fastapi import FastAPI, responses
 sys.path.append(str(Path(__file__).parent.parent))
 
 from src.api import main_router
-
-
-app = FastAPI()
+from src.config.config import settings
+from src.config.db_config import database
+from src.config.warmup import warm_up
+from src.dependencies.dependencies import books_insert_batcher
+from src.monitoring.metrics import MetricsMiddleware
+
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Создает и прогревает движки БД при старте воркера и закрывает их соединения при остановке.
+
+        Воркер начинает принимать запросы после прогрева пула или по истечении
+        DB_WARMUP_TIMEOUT; до завершения прогрева `/ready` отвечает 503.
+        При остановке накопленные пакетные вставки записываются до закрытия соединений.
+    """
+    database.connect()
+    connections = settings.DB_WARMUP_CONNECTIONS
+    if connections is None:
+        connections = settings.DB_POOL_SIZE
+    warm_up_task = asyncio.create_task(
+        warm_up(database, min(connections, settings.DB_POOL_SIZE),
+                retry_interval=settings.DB_WARMUP_RETRY_INTERVAL))
+    try:
+        await asyncio.wait_for(asyncio.shield(warm_up_task), settings.DB_WARMUP_TIMEOUT)
+    except TimeoutError:
+        logger.warning("Database warm-up is not finished after %.1f s, starting not ready",
+                       settings.DB_WARMUP_TIMEOUT)
+    yield
+    warm_up_task.cancel()
+    await books_insert_batcher.close()
+    await database.disconnect()
+
+
+app = FastAPI(lifespan=lifespan)
+app.add_middleware(MetricsMiddleware)
 
 @app.get("/", include_in_schema=False)
 async def root():
@@ -0,0 +1,44 @@
+"""add trgm indexes on title and author
+
+Revision ID: 5b2e9c4d7a1f
+Revises: 3cc3ba7ab7c3
+Create Date: 2026-10-18 10:12:41.207513
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5b2e9c4d7a1f"
+down_revision: Union[str, Sequence[str], None] = "3cc3ba7ab7c3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_book_title_lower_trgm",
+        "book",
+        [sa.text("lower(title) gin_trgm_ops")],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_book_author_lower_trgm",
+        "book",
+        [sa.text("lower(author) gin_trgm_ops")],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_book_author_lower_trgm", table_name="book")
+    op.drop_index("ix_book_title_lower_trgm", table_name="book")
@@ -1,13 +1,43 @@
-from sqlalchemy import String
+from sqlalchemy import String, Index, Computed, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 from src.config.db_config import Base
 
+BOOK_SEARCH_CONFIG = "russian"
+
 
 class Book(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     title: Mapped[str] = mapped_column(String(128), unique=True)
     author: Mapped[str] = mapped_column(String(32))
-    date_of_writing: Mapped[int] = mapped_column(nullable=True)
+    date_of_writing: Mapped[int] = mapped_column(nullable=True, index=True)
+    version: Mapped[int] = mapped_column(server_default="1")
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{BOOK_SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+            f"setweight(to_tsvector('{BOOK_SEARCH_CONFIG}', coalesce(author, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
 
+Index(
+    "ix_book_title_lower_trgm",
+    func.lower(Book.title).label("title_lower"),
+    postgresql_using="gin",
+    postgresql_ops={"title_lower": "gin_trgm_ops"},
+)
+Index(
+    "ix_book_author_lower_trgm",
+    func.lower(Book.author).label("author_lower"),
+    postgresql_using="gin",
+    postgresql_ops={"author_lower": "gin_trgm_ops"},
+)
+Index(
+    "ix_book_search_vector",
+    Book.search_vector,
+    postgresql_using="gin",
+)
@@ -0,0 +1,123 @@
+import time
+from contextvars import ContextVar
+
+from prometheus_client import Histogram
+from sqlalchemy import event
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Время обработки HTTP-запроса",
+    ["method", "route", "status_code"],
+)
+REQUEST_SQL_DURATION = Histogram(
+    "http_request_sql_duration_seconds",
+    "Суммарное время SQL-запросов за один HTTP-запрос",
+    ["method", "route"],
+)
+REQUEST_SQL_QUERIES = Histogram(
+    "http_request_sql_queries",
+    "Количество SQL-запросов за один HTTP-запрос",
+    ["method", "route"],
+    buckets=(0, 1, 2, 3, 5, 10, 25, 50, 100),
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Время выполнения SQL-запроса",
+    ["operation"],
+)
+
+
+class RequestMetrics:
+    """Метрики текущего HTTP-запроса, которые накапливают SQL-хуки движка.
+
+        Attributes:
+            scope: ASGI scope запроса.
+            sql_duration: Суммарное время SQL-запросов в секундах.
+            sql_queries: Количество выполненных SQL-запросов.
+    """
+
+    __slots__ = ("scope", "sql_duration", "sql_queries")
+
+    def __init__(self, scope):
+        self.scope = scope
+        self.sql_duration = 0.0
+        self.sql_queries = 0
+
+    @property
+    def route_path(self) -> str:
+        """Шаблон маршрута (например, /books/{book_id}) или "unmatched"."""
+        route = self.scope.get("route")
+        return route.path if route is not None else "unmatched"
+
+
+current_request: ContextVar[RequestMetrics | None] = ContextVar("current_request", default=None)
+
+
+class MetricsMiddleware:
+    """ASGI-middleware, записывающее гистограммы задержек по шаблону маршрута и статусу.
+
+       Вместе с общим временем запроса сохраняет время и количество SQL-запросов,
+       накопленные хуками `instrument_engine`, чтобы отделить время в БД
+       от маппинга и сериализации.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics = RequestMetrics(scope)
+        token = current_request.set(metrics)
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route_path = metrics.route_path
+            method = scope["method"]
+            REQUEST_LATENCY.labels(method, route_path, status_code).observe(
+                time.perf_counter() - start)
+            REQUEST_SQL_DURATION.labels(method, route_path).observe(metrics.sql_duration)
+            REQUEST_SQL_QUERIES.labels(method, route_path).observe(metrics.sql_queries)
+            current_request.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration = time.perf_counter() - conn.info["query_start_time"].pop()
+    DB_QUERY_DURATION.labels(statement.lstrip().split(None, 1)[0].upper()).observe(duration)
+    metrics = current_request.get()
+    if metrics is not None:
+        metrics.sql_duration += duration
+        metrics.sql_queries += 1
+
+
+def _handle_error(exception_context):
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_start_time"):
+        connection.info["query_start_time"].pop()
+
+
+def instrument_engine(engine):
+    """Подключает к движку хуки, измеряющие количество и время SQL-запросов.
+
+        Args:
+            engine: AsyncEngine приложения.
+    """
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
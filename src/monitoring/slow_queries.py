@@ -0,0 +1,84 @@
+import logging
+import random
+import time
+
+from sqlalchemy import event
+
+from src.config.config import settings
+from src.monitoring.metrics import current_request
+
+logger = logging.getLogger(__name__)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("slow_query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration_ms = (time.perf_counter() - conn.info["slow_query_start_time"].pop()) * 1000
+    if duration_ms < settings.SLOW_QUERY_THRESHOLD_MS:
+        return
+    metrics = current_request.get()
+    route = metrics.route_path if metrics is not None else "-"
+    logger.warning("Slow query %.1f ms on route %s: %s; parameters: %r",
+                   duration_ms, route, statement, parameters)
+
+    if (executemany
+            or not statement.lstrip().upper().startswith("SELECT")
+            or random.random() >= settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE):
+        return
+    plan = _explain_analyze(conn, statement, parameters)
+    if plan is not None:
+        logger.warning("EXPLAIN (ANALYZE, BUFFERS) for slow query on route %s:\n%s", route, plan)
+
+
+def _explain_analyze(conn, statement, parameters) -> str | None:
+    """Выполняет EXPLAIN (ANALYZE, BUFFERS) для запроса на том же соединении.
+
+        Запрос выполняется напрямую через курсор DBAPI (мимо событий движка)
+        внутри SAVEPOINT, чтобы ошибка EXPLAIN не прерывала транзакцию запроса.
+
+        Returns:
+            str | None: Текст плана или None, если получить его не удалось.
+    """
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute("SAVEPOINT slow_query_explain")
+        try:
+            cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters)
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+        except Exception:
+            cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+            raise
+        cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+        return plan
+    except Exception:
+        logger.exception("Failed to capture EXPLAIN for slow query")
+        return None
+    finally:
+        cursor.close()
+
+
+def _handle_error(exception_context):
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("slow_query_start_time"):
+        connection.info["slow_query_start_time"].pop()
+
+
+def instrument_slow_queries(engine):
+    """Подключает к движку журнал медленных запросов, если задан порог.
+
+        Запросы дольше SLOW_QUERY_THRESHOLD_MS логируются вместе с параметрами,
+        длительностью и маршрутом. Для доли SLOW_QUERY_EXPLAIN_SAMPLE_RATE
+        медленных SELECT дополнительно логируется план EXPLAIN (ANALYZE, BUFFERS);
+        ANALYZE выполняет запрос повторно.
+
+        Args:
+            engine: AsyncEngine приложения.
+    """
+    if settings.SLOW_QUERY_THRESHOLD_MS is None:
+        return
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
@@ -1,8 +1,14 @@
-from sqlalchemy import select, insert, update, delete
+from collections import defaultdict
+
+from sqlalchemy import (select, insert, update, delete, text, table, column, values,
+                        literal, literal_column, any_, cast, Integer, Boolean)
+from sqlalchemy.dialects.postgresql import insert as pg_insert, ARRAY
 from sqlalchemy.exc import NoResultFound, IntegrityError
 from pydantic import BaseModel
 
-from src.exceptions.exceptions import ObjectNotFoundException, UniqueObjectException
+from src.config.config import settings
+from src.exceptions.exceptions import (ObjectNotFoundException, UniqueObjectException,
+                                       VersionConflictException)
 
 
 class BaseRepository:
@@ -10,14 +16,122 @@ class BaseRepository:
 
         Предоставляет CRUD-операции (create, read, update, delete) для моделей БД.
         Использует асинхронный SQLAlchemy и автоматическое маппирование в Pydantic-схемы.
+        Читающие методы выполняются через `read_session` (реплика, если настроена),
+        изменяющие - через основную сессию `session`. При `read_your_writes`
+        объекты не берутся из кеша процесса: у каждого воркера он свой,
+        и запись, выполненная другим воркером, его не сбрасывает.
     """
 
     model = None
     mapper = None
+    unique_field = None
+    cache = None
+    list_cache = None
+    single_flight = None
 
-    def __init__(self, session):
-        """Инициализирует репозиторий с сессией SQLAlchemy."""
+    def __init__(self, session, read_session=None, read_your_writes=False):
+        """Инициализирует репозиторий с сессией SQLAlchemy и сессией для чтения."""
         self.session = session
+        self.read_session = read_session if read_session is not None else session
+        self.read_your_writes = read_your_writes
+
+    def _schema_columns(self, fields: list[str] | None = None):
+        """Колонки модели, соответствующие полям схемы ответа маппера.
+
+            Если переданы `fields`, выбираются только они и служебные `id`
+            и `version` (нужны для курсоров и ETag).
+        """
+        names = self.mapper.schema.model_fields
+        if fields is not None:
+            names = [name for name in names if name in fields or name in ("id", "version")]
+        return [getattr(self.model, name) for name in names]
+
+    def _cache_key(self, id):
+        """Ключ кеша одиночного объекта: имя модели и ID."""
+        return self.model.__name__, id
+
+    def _reads_primary(self) -> bool:
+        """Выполняются ли чтения репозитория на основной БД (без реплики)."""
+        return self.read_session is self.session
+
+    def _cache_get(self, id) -> BaseModel | None:
+        """Объект из кеша или None (кеш выключен, промах или запрос с read_your_writes)."""
+        if self.cache is None or self.read_your_writes:
+            return None
+        return self.cache.get(self._cache_key(id))
+
+    def _cache_epoch(self) -> int | None:
+        """Счетчик инвалидаций кеша до начала чтения (None, если кеш выключен)."""
+        return self.cache.invalidations if self.cache is not None else None
+
+    def _cache_set(self, obj: BaseModel, epoch: int | None = None):
+        """Кладет объект в кеш, если кеш включен.
+
+            Если передан `epoch` (см. _cache_epoch) и с тех пор из кеша
+            что-то удалялось, объект не сохраняется: он мог быть прочитан
+            до изменения или удаления, выполненного одновременно с чтением.
+        """
+        if self.cache is None:
+            return
+        if epoch is not None and self.cache.invalidations != epoch:
+            return
+        self.cache.set(self._cache_key(obj.id), obj)
+
+    def _cache_invalidate(self, *ids):
+        """Удаляет объекты с указанными ID из кеша, если кеш включен."""
+        if self.cache is not None:
+            for id in ids:
+                self.cache.delete(self._cache_key(id))
+
+    async def _cached_list(self, kind: str, params: dict, load):
+        """Возвращает результат списочного запроса из кеша списков или из БД.
+
+            Результаты чтения с основной БД и с реплики хранятся под разными
+            ключами, чтобы запрос с X-Read-Your-Writes не получил данные реплики.
+
+            Args:
+                kind (str): Вид запроса (часть ключа, например "rows" или "count").
+                params (dict): Нормализованные параметры запроса.
+                load: Callable без аргументов, возвращающий корутину запроса к БД.
+        """
+        if self.list_cache is None:
+            return await self._single_flight(kind, params, load)
+        namespace = self.model.__tablename__
+        primary = self._reads_primary()
+        key = self.list_cache.make_key(namespace, kind, {"params": params, "primary": primary})
+        generation, value = await self.list_cache.get(namespace, key)
+        if value is not None:
+            return value
+        value = await self._single_flight(kind, params, load)
+        if generation is not None:
+            await self.list_cache.set(namespace, key, generation, value, from_replica=not primary)
+        return value
+
+    async def _single_flight(self, kind: str, params: dict, load):
+        """Выполняет чтение, объединяя его с одновременными одинаковыми чтениями.
+
+            Чтения с основной БД и с реплики не объединяются между собой,
+            чтобы запрос с X-Read-Your-Writes не получил данные реплики.
+
+            Args:
+                kind (str): Вид запроса (часть ключа).
+                params (dict): Параметры запроса.
+                load: Callable без аргументов, возвращающий корутину запроса к БД.
+        """
+        if self.single_flight is None:
+            return await load()
+        key = self.single_flight.make_key(
+            self.model.__tablename__, kind,
+            {"params": params, "primary": self._reads_primary()})
+        return await self.single_flight.do(key, load)
+
+    async def _invalidate_reads(self):
+        """Делает устаревшими закешированные списки и выполняющиеся чтения таблицы
+        после записи в нее."""
+        if self.single_flight is not None:
+            self.single_flight.invalidate(self.model.__tablename__)
+        if self.list_cache is not None:
+            await self.list_cache.bump(self.model.__tablename__)
 
     async def get_all(self):
         """Получает все записи из таблицы.
@@ -26,10 +140,29 @@ class BaseRepository:
                 Список объектов BaseModel из библиотеки Pydantic.
         """
         query = select(self.model)
-        result = await self.session.execute(query)
+        result = await self.read_session.execute(query)
         books_models = result.scalars().all()
         return [self.mapper.map_to_schemas_object(obj) for obj in books_models]
 
+    async def stream_all(self, fetch_size: int):
+        """Построчно выдает все записи таблицы через серверный курсор.
+
+            В отличие от `get_all` не загружает таблицу в память целиком:
+            строки выбираются из курсора порциями по `fetch_size`.
+
+            Args:
+                fetch_size (int): Количество строк в одной выборке из курсора.
+
+            Yields:
+                BaseModel: Объект, преобразованный в Pydantic-схему.
+        """
+        query = (select(self.model)
+                 .order_by(self.model.id)
+                 .execution_options(yield_per=fetch_size))
+        result = await self.read_session.stream_scalars(query)
+        async for model in result:
+            yield self.mapper.map_to_schemas_object(model)
+
     async def get_one_by_id(self, **filter_by)-> BaseModel:
         """Получает одну запись по ID или другим фильтрам.
 
@@ -41,14 +174,98 @@ class BaseRepository:
 
         Raises:
             ObjectNotFoundException: Если объект не найден.
+
+        Примечание:
+            При включенном кеше поиск только по `id` сначала проверяет кеш
+            (кроме запросов с read_your_writes) и обращается к БД лишь
+            при промахе. В кеш попадают только объекты,
+            прочитанные с основной БД: отстающая реплика не должна подменить
+            в нем результат записи. Одновременные одинаковые запросы
+            выполняются в БД один раз (см. SingleFlight).
         """
-        query = select(self.model).filter_by(**filter_by)
-        result = await self.session.execute(query)
-        try:
-            model = result.scalars().one()
-        except NoResultFound:
-            raise ObjectNotFoundException
-        return self.mapper.map_to_schemas_object(model)
+        cacheable = self.cache is not None and filter_by.keys() == {"id"}
+        if cacheable:
+            cached = self._cache_get(filter_by["id"])
+            if cached is not None:
+                return cached
+        epoch = self._cache_epoch()
+        async def load():
+            query = select(self.model).filter_by(**filter_by)
+            result = await self.read_session.execute(query)
+            try:
+                model = result.scalars().one()
+            except NoResultFound:
+                raise ObjectNotFoundException
+            return self.mapper.map_to_schemas_object(model)
+
+        obj = await self._single_flight("one", filter_by, load)
+        if cacheable and self._reads_primary():
+            self._cache_set(obj, epoch)
+        return obj
+
+    async def get_one_fields(self, fields: list[str], **filter_by) -> dict:
+        """Получает одну запись, выбирая из БД только указанные поля.
+
+        Args:
+            fields (list[str]): Поля схемы ответа (к ним добавляются `id` и `version`).
+            **filter_by: Параметры фильтрации (например, `id=1`).
+
+        Returns:
+            dict: Значения выбранных полей.
+
+        Raises:
+            ObjectNotFoundException: Если объект не найден.
+
+        Примечание:
+            При включенном кеше поиск только по `id` берет поля из объекта в кеше.
+        """
+        if filter_by.keys() == {"id"}:
+            cached = self._cache_get(filter_by["id"])
+            if cached is not None:
+                return cached.model_dump(include={*fields, "id", "version"})
+        async def load():
+            query = select(*self._schema_columns(fields)).filter_by(**filter_by)
+            result = await self.read_session.execute(query)
+            row = result.one_or_none()
+            if row is None:
+                raise ObjectNotFoundException
+            return row._asdict()
+
+        return await self._single_flight("fields", {**filter_by, "fields": fields}, load)
+
+    async def get_many_by_ids(self, ids: list[int]) -> tuple[list[BaseModel], list[int]]:
+        """Получает записи по списку ID одним запросом `WHERE id = ANY(:ids)`.
+
+        Args:
+            ids (list[int]): ID записей; повторы учитываются один раз.
+
+        Returns:
+            tuple: Найденные объекты в порядке ID в запросе и список
+                ненайденных ID в том же порядке.
+
+        Примечание:
+            При включенном кеше из БД запрашиваются только ID, которых нет
+            в кеше; найденные объекты сохраняются в кеш, если прочитаны
+            с основной БД.
+        """
+        ids = list(dict.fromkeys(ids))
+        found = {}
+        for id in ids:
+            cached = self._cache_get(id)
+            if cached is not None:
+                found[id] = cached
+        to_load = [id for id in ids if id not in found]
+        if to_load:
+            epoch = self._cache_epoch()
+            query = select(self.model).where(self._ids_filter(to_load))
+            result = await self.read_session.execute(query)
+            for model in result.scalars().all():
+                obj = self.mapper.map_to_schemas_object(model)
+                if self._reads_primary():
+                    self._cache_set(obj, epoch)
+                found[obj.id] = obj
+        return ([found[id] for id in ids if id in found],
+                [id for id in ids if id not in found])
 
     async def create(self, data: BaseModel)-> BaseModel:
         """Создает новую запись в БД.
@@ -58,26 +275,155 @@ class BaseRepository:
 
         Raises:
             UniqueObjectException: Если нарушено ограничение уникальности.
+
+        Примечание:
+            Конфликт по `unique_field` обрабатывается через `ON CONFLICT DO NOTHING`
+            без ошибки в БД и отката транзакции.
         """
-        stmt = (insert(self.model)
+        if self.unique_field is None:
+            stmt = insert(self.model)
+        else:
+            stmt = (pg_insert(self.model)
+                    .on_conflict_do_nothing(index_elements=[self.unique_field]))
+        stmt = (stmt
                 .values(**data.model_dump(exclude_unset=True))
-                .returning(self.model))
+                .returning(*self._schema_columns()))
         try:
             result = await self.session.execute(stmt)
         except IntegrityError:
             raise UniqueObjectException
+        row = result.one_or_none()
+        if row is None:
+            raise UniqueObjectException
+        await self.session.commit()
+        await self._invalidate_reads()
+        obj = self.mapper.map_to_schemas_object(row)
+        self._cache_set(obj)
+        return obj
+
+    async def upsert(self, data: BaseModel) -> tuple[BaseModel, bool]:
+        """Создает запись или обновляет существующую с тем же значением `unique_field`.
+
+        Выполняется одним запросом `INSERT ... ON CONFLICT (unique_field) DO UPDATE
+        ... RETURNING` без исключения на конфликте; при обновлении версия записи
+        увеличивается.
+
+        Args:
+            data (BaseModel): Pydantic-схема с полными данными записи.
+
+        Returns:
+            tuple: Объект после вставки или обновления и флаг `True`,
+                если запись была вставлена.
+        """
+        values = data.model_dump()
+        stmt = pg_insert(self.model).values(**values)
+        stmt = (stmt
+                .on_conflict_do_update(
+                    index_elements=[self.unique_field],
+                    set_={**{name: stmt.excluded[name]
+                             for name in values if name != self.unique_field},
+                          "version": self.model.version + 1})
+                # xmax новой строки равен 0, у обновленной - ID обновившей транзакции
+                .returning(*self._schema_columns(),
+                           literal_column("xmax = 0", Boolean).label("inserted")))
+        result = await self.session.execute(stmt)
+        row = result.one()
         await self.session.commit()
-        return self.mapper.map_to_schemas_object(result.scalars().one())
+        await self._invalidate_reads()
+        obj = self.mapper.map_to_schemas_object(row)
+        self._cache_set(obj)
+        return obj, row.inserted
+
+    async def create_many(self,
+                          data: list[BaseModel],
+                          use_copy: bool = True) -> tuple[list[BaseModel], list[BaseModel]]:
+        """Создает пакет записей в одной транзакции, пропуская конфликтующие.
+
+        Небольшие пакеты вставляются одним многострочным
+        `INSERT ... ON CONFLICT (unique_field) DO NOTHING RETURNING`, крупные
+        (от `BULK_COPY_THRESHOLD` строк) загружаются через COPY во временную
+        таблицу и переносятся в основную тем же `INSERT ... SELECT`.
+
+        Args:
+            data (list[BaseModel]): Pydantic-схемы с данными для создания.
+            use_copy (bool): Если False, пакет любого размера вставляется
+                многострочным INSERT, без COPY.
+
+        Returns:
+            tuple: Созданные объекты и исходные данные строк, которые не были
+                вставлены из-за нарушения уникальности (в том числе дубликаты
+                внутри самого пакета).
+        """
+        if not data:
+            return [], []
+        rows = [item.model_dump() for item in data]
+        if use_copy and len(rows) >= settings.BULK_COPY_THRESHOLD:
+            inserted = await self._copy_insert(rows)
+        else:
+            stmt = (pg_insert(self.model)
+                    .values(rows)
+                    .on_conflict_do_nothing(index_elements=[self.unique_field])
+                    .returning(*self._schema_columns()))
+            result = await self.session.execute(stmt)
+            inserted = result.all()
+        await self.session.commit()
+        await self._invalidate_reads()
+
+        created = {getattr(row, self.unique_field): row for row in inserted}
+        created_objects, conflicts = [], []
+        for item, row in zip(data, rows):
+            created_row = created.pop(row[self.unique_field], None)
+            if created_row is None:
+                conflicts.append(item)
+            else:
+                obj = self.mapper.map_to_schemas_object(created_row)
+                self._cache_set(obj)
+                created_objects.append(obj)
+        return created_objects, conflicts
+
+    async def _copy_insert(self, rows: list[dict]) -> list:
+        """Загружает строки через COPY во временную таблицу и переносит их в основную.
+
+        Args:
+            rows (list[dict]): Данные строк с одинаковым набором ключей.
+
+        Returns:
+            list: Вставленные строки (колонки схемы ответа маппера).
+        """
+        columns = list(rows[0])
+        table_name = self.model.__tablename__
+        staging_name = f"{table_name}_bulk_staging"
+        await self.session.execute(text(
+            f"CREATE TEMP TABLE {staging_name} ON COMMIT DROP AS "
+            f"SELECT {', '.join(columns)} FROM {table_name} WITH NO DATA"
+        ))
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            staging_name,
+            records=[tuple(row.values()) for row in rows],
+            columns=columns,
+        )
+        staging = table(staging_name, *[column(name) for name in columns])
+        stmt = (pg_insert(self.model)
+                .from_select(columns, select(staging))
+                .on_conflict_do_nothing(index_elements=[self.unique_field])
+                .returning(*self._schema_columns()))
+        result = await self.session.execute(stmt)
+        return result.all()
 
     async def edit(self,
                    data: BaseModel,
                    exclude_unset: bool = False,
+                   expected_versions: list[int] | None = None,
                    **filter_by) -> BaseModel:
-        """Обновляет существующую запись.
+        """Обновляет существующую запись и увеличивает ее версию.
 
                 Args:
                     data (BaseModel): Pydantic-схема с данными для обновления.
                     exclude_unset (bool): Если True, обновляются только переданные поля.
+                    expected_versions (list[int] | None): Если заданы, запись обновляется,
+                        только пока ее версия входит в этот список (оптимистичная блокировка).
                     **filter_by: Параметры фильтрации (например, `id=1`).
 
                 Returns:
@@ -86,22 +432,121 @@ class BaseRepository:
                 Raises:
                     ObjectNotFoundException: Если объект не найден.
                     UniqueObjectException: Если нарушено ограничение уникальности.
+                    VersionConflictException: Если версия объекта не совпала с ожидаемой.
         """
         stmt = (
             update(self.model)
             .filter_by(**filter_by)
-            .values(**data.model_dump(exclude_unset=exclude_unset))
-            .returning(self.model))
+            .values(**data.model_dump(exclude_unset=exclude_unset),
+                    version=self.model.version + 1)
+            .returning(*self._schema_columns()))
+        if expected_versions is not None:
+            stmt = stmt.where(self.model.version.in_(expected_versions))
         try:
             result = await self.session.execute(stmt)
-            edit_model = result.scalars().one()
+            edit_row = result.one()
             await self.session.commit()
+            await self._invalidate_reads()
         except (IntegrityError, NoResultFound) as ex:
             if isinstance(ex, IntegrityError):
                 raise UniqueObjectException
+            if expected_versions is not None and await self._exists(**filter_by):
+                raise VersionConflictException
             raise ObjectNotFoundException
 
-        return self.mapper.map_to_schemas_object(edit_model)
+        self._cache_invalidate(edit_row.id)
+        return self.mapper.map_to_schemas_object(edit_row)
+
+    def _ids_filter(self, ids: list[int]):
+        """Условие `id = ANY(:ids)` с передачей списка одним параметром-массивом."""
+        return self.model.id == any_(literal(ids, ARRAY(Integer)))
+
+    async def edit_many(self, data: BaseModel, ids: list[int]) -> list[int]:
+        """Применяет одинаковый набор изменений к записям с указанными ID.
+
+                Обновление выполняется одним запросом `UPDATE ... WHERE id = ANY(:ids)`
+                в одной транзакции; версия каждой записи увеличивается.
+
+                Args:
+                    data (BaseModel): Pydantic-схема с изменениями (только переданные поля).
+                    ids (list[int]): ID обновляемых записей.
+
+                Returns:
+                    list[int]: ID фактически обновленных записей.
+
+                Raises:
+                    UniqueObjectException: Если нарушено ограничение уникальности.
+        """
+        stmt = (
+            update(self.model)
+            .where(self._ids_filter(ids))
+            .values(**data.model_dump(exclude_unset=True),
+                    version=self.model.version + 1)
+            .returning(self.model.id)
+            .execution_options(synchronize_session=False))
+        try:
+            result = await self.session.execute(stmt)
+        except IntegrityError:
+            raise UniqueObjectException
+        edited = result.scalars().all()
+        await self.session.commit()
+        await self._invalidate_reads()
+        self._cache_invalidate(*edited)
+        return edited
+
+    async def edit_each(self, data: list[BaseModel]) -> list[int]:
+        """Применяет к записям индивидуальные изменения в одной транзакции.
+
+                Изменения группируются по набору переданных полей, и каждая группа
+                обновляется одним запросом `UPDATE ... FROM (VALUES ...)`.
+                При повторе ID в пакете применяется последнее изменение.
+
+                Args:
+                    data (list[BaseModel]): Pydantic-схемы с полем `id` и изменениями.
+
+                Returns:
+                    list[int]: ID фактически обновленных записей.
+
+                Raises:
+                    UniqueObjectException: Если нарушено ограничение уникальности.
+        """
+        patches = {item.id: item.model_dump(exclude_unset=True, exclude={"id"})
+                   for item in data}
+        groups = defaultdict(list)
+        for id, patch in patches.items():
+            groups[tuple(sorted(patch))].append((id, *(patch[name] for name in sorted(patch))))
+
+        columns = self.model.__table__.c
+        edited = []
+        try:
+            for fields, rows in groups.items():
+                patch_values = (
+                    values(column("id", Integer),
+                           *[column(name, columns[name].type) for name in fields],
+                           name="patch")
+                    .data(rows))
+                stmt = (
+                    update(self.model)
+                    .where(self.model.id == patch_values.c.id)
+                    .values({**{name: cast(patch_values.c[name], columns[name].type)
+                                for name in fields},
+                             "version": self.model.version + 1})
+                    .returning(self.model.id)
+                    .execution_options(synchronize_session=False))
+                result = await self.session.execute(stmt)
+                edited.extend(result.scalars().all())
+        except IntegrityError:
+            raise UniqueObjectException
+        await self.session.commit()
+        await self._invalidate_reads()
+        self._cache_invalidate(*edited)
+        return edited
+
+    async def _exists(self, **filter_by) -> bool:
+        """Проверяет, есть ли в БД запись, подходящая под фильтры."""
+        query = select(self.model.id).filter_by(**filter_by)
+        result = await self.session.execute(query)
+        return result.first() is not None
 
     async def delete(self, **filter_by):
         """Удаляет запись из БД.
@@ -120,6 +565,25 @@ class BaseRepository:
             result = await self.session.execute(stmt)
             deleted_obj = result.scalars().one()
             await self.session.commit()
+            await self._invalidate_reads()
+            self._cache_invalidate(deleted_obj)
             return deleted_obj
         except NoResultFound:
             raise ObjectNotFoundException
+
+    async def delete_many(self, ids: list[int]) -> list[int]:
+        """Удаляет записи с указанными ID одним запросом `DELETE ... WHERE id = ANY(:ids)`.
+
+                Args:
+                    ids (list[int]): ID удаляемых записей.
+
+                Returns:
+                    list[int]: ID фактически удаленных записей.
+        """
+        stmt = delete(self.model).where(self._ids_filter(ids)).returning(self.model.id)
+        result = await self.session.execute(stmt)
+        deleted = result.scalars().all()
+        await self.session.commit()
+        await self._invalidate_reads()
+        self._cache_invalidate(*deleted)
+        return deleted
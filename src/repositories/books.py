@@ -1,9 +1,14 @@
 from pydantic import BaseModel
-from sqlalchemy import select, func
+import json
 
+from sqlalchemy import select, func, text, tuple_, cast, literal, REAL
+
+from src.config.config import settings
 from src.repositories.base import BaseRepository
-from src.models.books import Book
+from src.repositories.cache import LRUCache, make_list_cache
+from src.models.books import Book, BOOK_SEARCH_CONFIG
 from src.repositories.mapper.books import BooksMapper
+from src.repositories.single_flight import SingleFlight
 
 
 class BooksRepository(BaseRepository):
@@ -14,45 +19,218 @@ class BooksRepository(BaseRepository):
 
     model = Book
     mapper = BooksMapper
+    unique_field = "title"
+    cache = (LRUCache(max_size=settings.ITEM_CACHE_MAX_SIZE, ttl=settings.ITEM_CACHE_TTL)
+             if settings.ITEM_CACHE_ENABLED else None)
+    list_cache = make_list_cache(settings.LIST_CACHE_BACKEND,
+                                 max_size=settings.LIST_CACHE_MAX_SIZE,
+                                 ttl=settings.LIST_CACHE_TTL,
+                                 redis_url=settings.REDIS_URL,
+                                 replica_lag=settings.DB_REPLICA_MAX_LAG)
+    single_flight = SingleFlight() if settings.SINGLE_FLIGHT_ENABLED else None
+
+    @staticmethod
+    def _normalize_params(**params) -> dict:
+        """Приводит параметры списочного запроса к виду ключа кеша списков.
+
+                Пустые значения отбрасываются, подстроки автора и названия
+                приводятся к нижнему регистру (поиск по ним регистронезависимый),
+                поэтому равнозначные запросы попадают в одну запись кеша.
+        """
+        for name in ("author", "title"):
+            if params.get(name):
+                params[name] = params[name].lower()
+        return {name: value for name, value in params.items() if value not in (None, "")}
+
+    @staticmethod
+    def _substring_filter(column, value: str):
+        """Строит регистронезависимый поиск по подстроке для триграммного индекса.
+
+                Шаблон `%value%` собирается целиком на стороне Python и передается
+                одним параметром, поэтому предикат `lower(column) LIKE :pattern`
+                обслуживается GIN-индексом `gin_trgm_ops` по `lower(column)`
+                вместо последовательного сканирования таблицы.
+
+                Args:
+                    column: Колонка модели (например, `Book.title`).
+                    value: Подстрока для поиска.
+        """
+        escaped = value.lower().replace("/", "//").replace("%", "/%").replace("_", "/_")
+        return func.lower(column).like(f"%{escaped}%", escape="/")
+
+    def _apply_filters(
+            self,
+            query,
+            author=None,
+            title=None,
+            date_of_writing=None,
+            year_from=None,
+            year_to=None,
+    ):
+        """Добавляет к запросу фильтры списка книг (см. get_filtered_books_rows)."""
+        if date_of_writing is not None:
+            query = query.filter(Book.date_of_writing == date_of_writing)
+        if year_from is not None:
+            query = query.filter(Book.date_of_writing >= year_from)
+        if year_to is not None:
+            query = query.filter(Book.date_of_writing <= year_to)
 
+        if author:
+            query = query.filter(self._substring_filter(Book.author, author))
+        if title:
+            query = query.filter(self._substring_filter(Book.title, title))
+        return query
+
+    @staticmethod
+    def _paginate(query, limit, offset=None, after_id=None):
+        """Добавляет к запросу сортировку по ID и постраничную или курсорную пагинацию."""
+        if after_id is not None:
+            query = query.filter(Book.id > after_id)
+
+        query = query.order_by(Book.id).limit(limit)
+        if offset:
+            query = query.offset(offset)
+        return query
+
+    async def get_filtered_books_list(self, **filters) -> list[BaseModel | None]:
+        """Получает отфильтрованный список книг с пагинацией в виде Pydantic-схем.
+
+                Обертка над get_filtered_books_rows (те же аргументы), результат
+                которой проходит через маппер.
 
-    async def get_filtered_books_list(
+                Returns:
+                    list[BaseModel]: Список книг в формате Pydantic-схемы
+        """
+        rows = await self.get_filtered_books_rows(**filters)
+        return [self.mapper.map_to_schemas_object(row) for row in rows]
+
+    async def get_filtered_books_rows(
             self,
             author,
             title,
             date_of_writing,
             limit,
-            offset,
-    ) -> list[BaseModel | None]:
-        """Получает отфильтрованный список книг с пагинацией.
+            year_from=None,
+            year_to=None,
+            offset=None,
+            after_id=None,
+            fields=None,
+    ) -> list[dict]:
+        """Получает отфильтрованный список книг в виде словарей без Pydantic-валидации.
+
+                Выбираются только колонки схемы ответа, строки возвращаются
+                как словари для сериализации ответа напрямую в JSON.
 
                 Args:
                     author: Фильтр по автору (регистронезависимый поиск по подстроке)
                     title: Фильтр по названию (регистронезависимый поиск по подстроке)
-                    date_of_writing: Фильтр по году написания
+                    date_of_writing: Фильтр по году написания (точное совпадение)
                     limit: Количество книг на странице
+                    year_from: Нижняя граница года написания (включительно)
+                    year_to: Верхняя граница года написания (включительно)
                     offset: Смещение для пагинации (limit * (page - 1))
+                    after_id: ID последней книги предыдущей страницы (курсорная пагинация).
+                        Страница начинается сразу после него без пропуска строк через OFFSET.
+                    fields: Поля схемы ответа, которые нужно выбрать (к ним всегда
+                        добавляются `id` и `version`; None - все поля).
 
                 Returns:
-                    list[BaseModel]: Список книг в формате Pydantic-схемы
+                    list[dict]: Список книг с ключами полей схемы ответа
+
+                Примечание:
+                    При включенном кеше списков результат берется из него, пока
+                    в таблицу не было записи (см. BaseRepository._cached_list).
         """
+        async def load():
+            query = self._apply_filters(
+                select(*self._schema_columns(fields)), author, title, date_of_writing, year_from, year_to)
+            query = self._paginate(query, limit, offset, after_id)
+            result = await self.read_session.execute(query)
+            return [row._asdict() for row in result]
 
-        query = select(self.model)
+        params = self._normalize_params(
+            author=author, title=title, date_of_writing=date_of_writing,
+            year_from=year_from, year_to=year_to,
+            limit=limit, offset=offset, after_id=after_id, fields=fields)
+        return await self._cached_list("rows", params, load)
 
-        if date_of_writing:
-            years_of_writing = select(self.model.date_of_writing)
-            query = query.filter(Book.date_of_writing.in_(years_of_writing))
+    async def count_filtered_books(self, **filters) -> int:
+        """Точно подсчитывает книги, подходящие под фильтры списка (COUNT(*)).
 
-        if author:
-            query = query.filter(
-                func.lower(Book.author).contains((func.lower(author)))
-            )
-        if title:
-            query = query.filter(
-                func.lower(Book.title).contains((func.lower(title)))
-            )
+                Args:
+                    **filters: Фильтры get_filtered_books_rows (author, title,
+                        date_of_writing, year_from, year_to).
+        """
+        async def load():
+            query = self._apply_filters(select(func.count()).select_from(Book), **filters)
+            result = await self.read_session.execute(query)
+            return result.scalar_one()
 
-        query = query.limit(limit).offset(offset)
+        return await self._cached_list("count", self._normalize_params(**filters), load)
+
+    async def estimate_filtered_books(self, **filters) -> int:
+        """Оценивает количество книг, подходящих под фильтры, без их подсчета.
+
+                Без фильтров берется `pg_class.reltuples` (обновляется ANALYZE/autovacuum),
+                с фильтрами - оценка строк планировщика из `EXPLAIN (FORMAT JSON)`.
+
+                Args:
+                    **filters: Фильтры get_filtered_books_rows (author, title,
+                        date_of_writing, year_from, year_to).
+        """
+        if not any(value is not None for value in filters.values()):
+            result = await self.read_session.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+                {"table": Book.__tablename__})
+            reltuples = result.scalar_one()
+            # -1: таблица еще ни разу не анализировалась, берем оценку планировщика
+            if reltuples >= 0:
+                return reltuples
+
+        connection = await self.read_session.connection()
+        query = self._apply_filters(select(Book.id), **filters)
+        # Значения фильтров передаются параметрами: текст запроса один для любых
+        # значений и не вытесняет другие запросы из кеша подготовленных выражений
+        compiled = query.compile(dialect=connection.dialect)
+        params = tuple(compiled.params[name] for name in compiled.positiontup)
+        result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", params)
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    async def search_books(
+            self,
+            q: str,
+            limit: int,
+            after_rank: float | None = None,
+            after_id: int | None = None,
+    ) -> list[dict]:
+        """Полнотекстовый поиск по названию и автору с ранжированием.
+
+                Использует сгенерированную колонку `search_vector` и ее GIN-индекс,
+                результаты сортируются по `ts_rank` (совпадения в названии весят
+                больше, чем в авторе), затем по ID. Следующая страница выбирается
+                по ключу (rank, id) последней книги без OFFSET.
+
+                Args:
+                    q: Поисковый запрос в синтаксисе websearch_to_tsquery
+                        (слова, "фразы", OR, -исключение).
+                    limit: Количество книг на странице
+                    after_rank: Ранг последней книги предыдущей страницы
+                    after_id: ID последней книги предыдущей страницы
+
+                Returns:
+                    list[dict]: Книги с ключами полей схемы ответа и ключом `rank`
+        """
+        ts_query = func.websearch_to_tsquery(BOOK_SEARCH_CONFIG, q)
+        rank = func.ts_rank(Book.search_vector, ts_query, type_=REAL)
+        query = (select(*self._schema_columns(), rank.label("rank"))
+                 .where(Book.search_vector.bool_op("@@")(ts_query)))
+        if after_id is not None:
+            query = query.where(
+                tuple_(rank, Book.id) < tuple_(cast(literal(after_rank), REAL), after_id))
+        query = query.order_by(rank.desc(), Book.id.desc()).limit(limit)
 
-        result = await self.session.execute(query)
-        return [self.mapper.map_to_schemas_object(model) for model in result.scalars().all()]
+        result = await self.read_session.execute(query)
+        return [row._asdict() for row in result]
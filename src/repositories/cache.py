@@ -0,0 +1,285 @@
+import logging
+import time
+from collections import OrderedDict
+
+import orjson
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+
+class LRUCache:
+    """Ограниченный по размеру LRU-кеш с временем жизни записей.
+
+        Хранится в памяти процесса и разделяется всеми экземплярами репозитория.
+        При переполнении вытесняется запись, к которой дольше всего не обращались.
+
+        Attributes:
+            max_size: Максимальное количество записей.
+            ttl: Время жизни записи в секундах.
+            hits: Количество попаданий.
+            misses: Количество промахов (включая просроченные записи).
+            evictions: Количество записей, вытесненных из-за переполнения.
+            expirations: Количество записей, удаленных по истечении TTL.
+            invalidations: Количество вызовов delete; читатель запоминает его
+                перед запросом к БД и не кладет результат в кеш, если за время
+                запроса объект мог быть изменен (см. BaseRepository._cache_set).
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        """Инициализирует пустой кеш.
+
+                Args:
+                    max_size (int): Максимальное количество записей.
+                    ttl (float): Время жизни записи в секундах.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        """Возвращает значение по ключу или None, если его нет или оно просрочено."""
+        item = self._data.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+        value, expires_at = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key, value):
+        """Сохраняет значение, при переполнении вытесняя самую старую запись."""
+        self._data[key] = (value, time.monotonic() + self.ttl)
+        self._data.move_to_end(key)
+        if len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key):
+        """Удаляет запись, если она есть."""
+        self._data.pop(key, None)
+        self.invalidations += 1
+
+    def __len__(self):
+        """Количество записей в кеше (включая еще не удаленные просроченные)."""
+        return len(self._data)
+
+    def stats(self) -> dict[str, int | float]:
+        """Возвращает счетчики кеша для подбора его размера и TTL."""
+        return {
+            "size": len(self),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+class MemoryListCacheBackend:
+    """Хранилище кеша списков в памяти процесса.
+
+        Значения хранятся в LRUCache, счетчики поколений - в словаре
+        (они не вытесняются). Не разделяется между воркерами uvicorn.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        """Инициализирует пустое хранилище.
+
+                Args:
+                    max_size (int): Максимальное количество значений.
+                    ttl (float): Время жизни значения в секундах.
+        """
+        self._values = LRUCache(max_size=max_size, ttl=ttl)
+        self._generations = {}
+
+    async def get(self, generation_key: str, key: str):
+        """Возвращает текущее поколение и сохраненное значение (или None)."""
+        return self._generations.get(generation_key, 0), self._values.get(key)
+
+    async def set(self, key: str, value):
+        """Сохраняет значение."""
+        self._values.set(key, value)
+
+    async def incr(self, generation_key: str) -> int:
+        """Увеличивает счетчик поколения и возвращает новое значение."""
+        self._generations[generation_key] = self._generations.get(generation_key, 0) + 1
+        return self._generations[generation_key]
+
+    def size(self) -> int:
+        """Количество сохраненных значений."""
+        return len(self._values)
+
+
+class RedisListCacheBackend:
+    """Хранилище кеша списков в Redis (или совместимом сервере), общее для воркеров.
+
+        Поколение и значение читаются одной командой MGET, значения хранятся
+        в JSON с TTL. Ошибки Redis не прерывают запрос: чтение считается промахом,
+        запись пропускается.
+    """
+
+    def __init__(self, client: Redis, ttl: float):
+        """Инициализирует хранилище поверх клиента Redis.
+
+                Args:
+                    client (Redis): Асинхронный клиент redis-py (или совместимый, например fakeredis).
+                    ttl (float): Время жизни значения в секундах.
+        """
+        self.client = client
+        self.ttl = ttl
+
+    async def get(self, generation_key: str, key: str):
+        """Возвращает текущее поколение и сохраненное значение (или None).
+
+                При недоступности Redis возвращает поколение None - результат
+                запроса в этом случае не кешируется.
+        """
+        try:
+            generation, item = await self.client.mget(generation_key, key)
+        except RedisError as ex:
+            logger.warning("List cache read failed: %r", ex)
+            return None, None
+        return int(generation or 0), orjson.loads(item) if item is not None else None
+
+    async def set(self, key: str, value):
+        """Сохраняет значение с TTL."""
+        try:
+            await self.client.set(key, orjson.dumps(value), px=int(self.ttl * 1000))
+        except RedisError as ex:
+            logger.warning("List cache write failed: %r", ex)
+
+    async def incr(self, generation_key: str) -> int | None:
+        """Увеличивает счетчик поколения и возвращает новое значение
+        (None, если Redis недоступен)."""
+        try:
+            return await self.client.incr(generation_key)
+        except RedisError as ex:
+            logger.warning("List cache invalidation failed: %r", ex)
+            return None
+
+    def size(self) -> None:
+        """Размер хранилища не отслеживается."""
+        return None
+
+
+class ListCache:
+    """Кеш результатов списочных запросов, сбрасываемый поколением таблицы.
+
+        Каждая запись хранится вместе с номером поколения таблицы, действовавшим
+        на момент чтения из БД. Запись в таблицу увеличивает поколение, после
+        чего все ранее сохраненные результаты считаются устаревшими и
+        вытесняются по TTL/LRU, без перебора ключей.
+
+        Результат чтения с реплики, начатого вскоре после записи этого процесса,
+        может не содержать ее, поэтому в течение `replica_lag` секунд после
+        записи он не сохраняется в поколении, созданном этой записью (и более
+        новых): иначе устаревшие строки выдавались бы до следующей записи.
+
+        Attributes:
+            backend: Хранилище (MemoryListCacheBackend или RedisListCacheBackend).
+            prefix (str): Префикс ключей.
+            replica_lag (float): Допустимое отставание реплик в секундах.
+            hits: Количество попаданий.
+            misses: Количество промахов (включая устаревшие записи).
+    """
+
+    def __init__(self, backend, prefix: str = "list_cache", replica_lag: float = 0):
+        """Инициализирует кеш поверх хранилища.
+
+                Args:
+                    backend: Хранилище значений и счетчиков поколений.
+                    prefix (str): Префикс ключей (разделяет приложения в общем Redis).
+                    replica_lag (float): Допустимое отставание реплик в секундах.
+        """
+        self.backend = backend
+        self.prefix = prefix
+        self.replica_lag = replica_lag
+        self._last_writes = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _generation_key(self, namespace: str) -> str:
+        """Ключ счетчика поколения таблицы."""
+        return f"{self.prefix}:{namespace}:generation"
+
+    def make_key(self, namespace: str, kind: str, params: dict) -> str:
+        """Строит ключ записи из вида запроса и нормализованных параметров."""
+        return f"{self.prefix}:{namespace}:{kind}:" + orjson.dumps(
+            params, option=orjson.OPT_SORT_KEYS).decode()
+
+    async def get(self, namespace: str, key: str):
+        """Возвращает поколение таблицы и значение, если оно сохранено в текущем поколении.
+
+                Returns:
+                    tuple: Поколение (None - кеш недоступен) и значение (None - промах).
+        """
+        generation, item = await self.backend.get(self._generation_key(namespace), key)
+        if item is not None and generation is not None:
+            item_generation, value = item
+            if item_generation == generation:
+                self.hits += 1
+                return generation, value
+        self.misses += 1
+        return generation, None
+
+    async def set(self, namespace: str, key: str, generation: int, value,
+                  from_replica: bool = False):
+        """Сохраняет значение, прочитанное из БД в указанном поколении.
+
+                Значение, прочитанное с реплики (`from_replica`), не сохраняется,
+                если меньше `replica_lag` секунд назад этот процесс записал
+                в таблицу и `generation` не старше поколения этой записи.
+        """
+        if from_replica and namespace in self._last_writes:
+            write_generation, written_at = self._last_writes[namespace]
+            if (time.monotonic() - written_at < self.replica_lag
+                    and (write_generation is None or generation >= write_generation)):
+                return
+        await self.backend.set(key, (generation, value))
+
+    async def bump(self, namespace: str):
+        """Увеличивает поколение таблицы, делая устаревшими все ее записи."""
+        generation = await self.backend.incr(self._generation_key(namespace))
+        self._last_writes[namespace] = generation, time.monotonic()
+
+    def stats(self) -> dict[str, int | None]:
+        """Возвращает счетчики кеша списков."""
+        return {
+            "size": self.backend.size(),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def make_list_cache(backend: str, max_size: int, ttl: float,
+                    redis_url: str | None = None, replica_lag: float = 0) -> ListCache | None:
+    """Создает кеш списков с выбранным хранилищем.
+
+            Args:
+                backend (str): "memory", "redis" или "none" (кеш выключен).
+                max_size (int): Максимальное количество записей для хранилища в памяти.
+                ttl (float): Время жизни записи в секундах.
+                redis_url (str | None): URL Redis для хранилища "redis".
+                replica_lag (float): Допустимое отставание реплик в секундах.
+    """
+    if backend == "memory":
+        return ListCache(MemoryListCacheBackend(max_size=max_size, ttl=ttl),
+                         replica_lag=replica_lag)
+    if backend == "redis":
+        return ListCache(RedisListCacheBackend(Redis.from_url(redis_url), ttl=ttl),
+                         replica_lag=replica_lag)
+    return None
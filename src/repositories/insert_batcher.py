@@ -0,0 +1,105 @@
+import asyncio
+
+from pydantic import BaseModel
+
+from src.exceptions.exceptions import UniqueObjectException
+
+
+class InsertBatcher:
+    """Собирает одиночные вставки в пакеты и записывает каждый пакет одной транзакцией.
+
+        Вставки, пришедшие в течение `window` секунд после первой из пакета
+        (или до набора `max_size` штук), передаются в `insert_many` одним
+        вызовом - одна многострочная вставка и один коммит вместо отдельной
+        транзакции на каждую. Результат каждой строки возвращается ее вызывающему:
+        созданный объект или UniqueObjectException при конфликте уникальности.
+        Если пакет целиком не записался (например, одна строка не прошла
+        ограничения БД), строки повторяются по одной, и ошибку получает
+        только вызывающий, чья строка ее вызвала.
+
+        Attributes:
+            insert_many: Асинхронная функция, принимающая список схем и возвращающая
+                созданные объекты (в порядке входных данных) и конфликтующие схемы
+                (см. BaseRepository.create_many).
+            window (float): Время сбора пакета в секундах.
+            max_size (int): Размер пакета, при котором он записывается сразу.
+    """
+
+    def __init__(self, insert_many, window: float, max_size: int):
+        """Инициализирует пустой сборщик.
+
+                Args:
+                    insert_many: Функция пакетной вставки.
+                    window (float): Время сбора пакета в секундах.
+                    max_size (int): Максимальный размер пакета.
+        """
+        self.insert_many = insert_many
+        self.window = window
+        self.max_size = max_size
+        self._pending = []
+        self._timer = None
+        self._flushes = set()
+
+    async def submit(self, data: BaseModel) -> BaseModel:
+        """Добавляет строку в текущий пакет и ждет его записи.
+
+                Args:
+                    data (BaseModel): Pydantic-схема с данными для создания.
+
+                Returns:
+                    BaseModel: Созданный объект.
+
+                Raises:
+                    UniqueObjectException: Если нарушено ограничение уникальности.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((data, future))
+        if len(self._pending) >= self.max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self):
+        """Отправляет накопленный пакет на запись в фоновой задаче."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.create_task(self._insert(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _insert(self, batch: list):
+        """Записывает пакет и раздает результаты ожидающим вызовам."""
+        try:
+            created, conflicts = await self.insert_many([data for data, _ in batch])
+        except Exception as ex:
+            if len(batch) > 1:
+                for item in batch:
+                    await self._insert([item])
+                return
+            _, future = batch[0]
+            if not future.done():
+                future.set_exception(ex)
+            return
+        conflicting = {id(data) for data in conflicts}
+        created = iter(created)
+        for data, future in batch:
+            # Запрос мог быть отменен (клиент отключился), строка при этом уже записана
+            if id(data) in conflicting:
+                if not future.done():
+                    future.set_exception(UniqueObjectException())
+                continue
+            obj = next(created)
+            if not future.done():
+                future.set_result(obj)
+
+    async def close(self):
+        """Записывает накопленный пакет и дожидается всех начатых записей."""
+        self._flush()
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
@@ -0,0 +1,83 @@
+import asyncio
+from collections import defaultdict
+
+import orjson
+
+
+class SingleFlight:
+    """Объединяет одновременные одинаковые чтения в один запрос к БД.
+
+        Первый вызов с данным ключом выполняет запрос, остальные, пришедшие
+        до его завершения, ждут и получают тот же результат (или то же
+        исключение), не занимая соединение из пула. Результат не сохраняется:
+        после завершения запроса следующий вызов снова идет в БД.
+
+        В ключ входит поколение записей таблицы. Запись в таблицу увеличивает
+        его, поэтому чтение, начатое после записи, никогда не присоединится
+        к запросу, начатому до нее.
+
+        Attributes:
+            shared: Количество вызовов, получивших результат чужого запроса.
+    """
+
+    def __init__(self):
+        """Инициализирует пустой реестр выполняющихся запросов."""
+        self._calls = {}
+        self._generations = defaultdict(int)
+        self.shared = 0
+
+    def invalidate(self, namespace: str):
+        """Увеличивает поколение таблицы после записи в нее."""
+        self._generations[namespace] += 1
+
+    def make_key(self, namespace: str, kind: str, params: dict) -> tuple:
+        """Строит ключ запроса с текущим поколением таблицы."""
+        return (namespace, self._generations[namespace], kind,
+                orjson.dumps(params, option=orjson.OPT_SORT_KEYS))
+
+    async def do(self, key: tuple, load):
+        """Выполняет запрос или присоединяется к уже выполняющемуся с тем же ключом.
+
+                Args:
+                    key (tuple): Ключ из make_key.
+                    load: Callable без аргументов, возвращающий корутину запроса к БД.
+
+                Returns:
+                    Результат запроса.
+        """
+        future = self._calls.get(key)
+        if future is not None:
+            self.shared += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # Отменен сам вызов - пробрасываем; отменен выполнявший
+                # запрос (например, клиент отключился) - выполняем запрос сами.
+                if asyncio.current_task().cancelling() or not future.cancelled():
+                    raise
+            return await load()
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await load()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as ex:
+            future.set_exception(ex)
+            # Помечаем исключение полученным, если к запросу никто не присоединился
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._calls.pop(key, None)
+
+    def stats(self) -> dict[str, int]:
+        """Возвращает количество выполняющихся запросов и объединенных вызовов."""
+        return {
+            "in_flight": len(self._calls),
+            "shared": self.shared,
+        }
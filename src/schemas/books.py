@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
+
+from src.constants import BATCH_MAX_IDS
 
 
 class Books(BaseModel):
@@ -9,6 +11,7 @@ class BooksResponse(Books):
     title: str
     author: str
     date_of_writing: int | None = None
+    version: int = 1
 
 
 class BooksRequestAdd(BaseModel):
@@ -17,6 +20,11 @@ class BooksRequestAdd(BaseModel):
     date_of_writing: int | None = None
 
 
+class BooksRequestUpsert(BaseModel):
+    author: str
+    date_of_writing: int | None = None
+
+
 class BooksRequestPUT(BaseModel):
     title: str
     author: str
@@ -27,3 +35,28 @@ class BooksRequestPATCH(BaseModel):
     title: str | None = None
     author: str | None = None
     date_of_writing: int | None = None
+
+
+class BooksPatchItem(BooksRequestPATCH):
+    id: int
+
+
+class BooksRequestBulkPATCH(BaseModel):
+    ids: list[int] | None = Field(None, max_length=BATCH_MAX_IDS)
+    patch: BooksRequestPATCH | None = None
+    patches: list[BooksPatchItem] | None = Field(None, max_length=BATCH_MAX_IDS)
+
+    @model_validator(mode="after")
+    def check_mode(self):
+        shared = self.ids is not None or self.patch is not None
+        if shared == (self.patches is not None):
+            raise ValueError("Pass either ids with patch, or patches")
+        if shared and (not self.ids or self.patch is None):
+            raise ValueError("Shared patch requires both ids and patch")
+        if not shared and not self.patches:
+            raise ValueError("patches must not be empty")
+        return self
+
+
+class BooksRequestBatch(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=BATCH_MAX_IDS)
@@ -0,0 +1,35 @@
+import os
+import sys
+from pathlib import Path
+
+import uvicorn
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.config.config import settings
+
+
+def main():
+    """Production-запуск приложения: несколько воркеров на uvloop и httptools.
+
+        Каждый воркер - отдельный процесс со своим движком БД, который создается
+        в lifespan приложения. По SIGTERM/SIGINT воркеры перестают принимать
+        новые соединения, до SERVER_GRACEFUL_SHUTDOWN_TIMEOUT секунд дожидаются
+        текущих запросов и закрывают пулы соединений.
+    """
+    uvicorn.run(
+        app="src.main:app",
+        host=settings.SERVER_HOST,
+        port=settings.SERVER_PORT,
+        workers=settings.SERVER_WORKERS or os.cpu_count(),
+        loop="uvloop",
+        http="httptools",
+        lifespan="on",
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_SHUTDOWN_TIMEOUT,
+        timeout_keep_alive=settings.SERVER_KEEPALIVE_TIMEOUT,
+        proxy_headers=True,
+    )
+
+
+if __name__ == '__main__':
+    main()
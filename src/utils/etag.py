@@ -0,0 +1,60 @@
+import hashlib
+
+import orjson
+
+from src.exceptions.exceptions import VersionConflictException
+
+
+def book_etag(book) -> str:
+    """ETag объекта по его ID и версии строки: `"<id>-<version>"`."""
+    return f'"{book.id}-{book.version}"'
+
+
+def projection_etag(book: dict, fields: list[str]) -> str:
+    """Слабый ETag частичного представления объекта: версия строки и набор полей.
+
+        Отличается от ETag полного объекта, поэтому не подходит для If-Match
+        и не совпадет с ETag другого набора полей в If-None-Match.
+    """
+    return f'W/"{book["id"]}-{book["version"]}-{",".join(fields)}"'
+
+
+def list_etag(books: list[dict], *extra) -> str:
+    """Слабый ETag страницы списка по ID и версиям книг (и доп. значениям, например курсору)."""
+    payload = orjson.dumps([[book["id"], book["version"]] for book in books] + list(extra))
+    return f'W/"{hashlib.blake2b(payload, digest_size=12).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Проверяет заголовок If-None-Match (слабое сравнение, список или `*`)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in tags
+
+
+def if_match_versions(if_match: str | None, id: int) -> list[int] | None:
+    """Извлекает ожидаемые версии объекта из заголовка If-Match.
+
+        Args:
+            if_match (str | None): Значение заголовка If-Match.
+            id (int): ID изменяемого объекта.
+
+        Returns:
+            list[int] | None: Допустимые версии или None, если заголовка нет или он равен `*`.
+
+        Raises:
+            VersionConflictException: Если ни один ETag не относится к объекту.
+    """
+    if not if_match or if_match.strip() == "*":
+        return None
+    versions = []
+    for tag in if_match.split(","):
+        tag_id, _, version = tag.strip().strip('"').partition("-")
+        if tag_id == str(id) and version.isdigit():
+            versions.append(int(version))
+    if not versions:
+        raise VersionConflictException
+    return versions
@@ -0,0 +1,59 @@
+import csv
+import io
+
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+async def to_ndjson(objects):
+    """Сериализует поток Pydantic-объектов в NDJSON (один JSON-объект на строку).
+
+        Args:
+            objects: Асинхронный итератор Pydantic-объектов.
+
+        Yields:
+            str: Фрагменты выгрузки размером около EXPORT_CHUNK_SIZE.
+                Первая строка отдается сразу, не дожидаясь заполнения фрагмента.
+    """
+    chunk = []
+    size = 0
+    first = True
+    async for obj in objects:
+        line = obj.model_dump_json() + "\n"
+        chunk.append(line)
+        size += len(line)
+        if first or size >= EXPORT_CHUNK_SIZE:
+            yield "".join(chunk)
+            chunk, size, first = [], 0, False
+    if chunk:
+        yield "".join(chunk)
+
+
+async def to_csv(objects, fieldnames: list[str]):
+    """Сериализует поток Pydantic-объектов в CSV с заголовком.
+
+        Args:
+            objects: Асинхронный итератор Pydantic-объектов.
+            fieldnames (list[str]): Порядок колонок в выгрузке.
+
+        Yields:
+            str: Заголовок, затем фрагменты выгрузки размером около EXPORT_CHUNK_SIZE.
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames)
+    writer.writeheader()
+    yield buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    async for obj in objects:
+        writer.writerow(obj.model_dump())
+        if buffer.tell() >= EXPORT_CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
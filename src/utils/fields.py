@@ -0,0 +1,28 @@
+from src.exceptions.exceptions import InvalidFieldsException
+
+
+def parse_fields(fields: str | None, allowed) -> list[str] | None:
+    """Разбирает параметр `fields=title,author` в список полей ответа.
+
+        Args:
+            fields (str | None): Поля через запятую.
+            allowed: Допустимые поля в порядке схемы ответа (например, `model_fields`).
+
+        Returns:
+            list[str] | None: Запрошенные поля в порядке схемы без повторов
+                или None, если параметр не передан (нужны все поля).
+
+        Raises:
+            InvalidFieldsException: Если запрошено неизвестное или пустое поле.
+    """
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields.split(",")}
+    if not requested <= set(allowed):
+        raise InvalidFieldsException
+    return [name for name in allowed if name in requested]
+
+
+def project(row: dict, fields: list[str]) -> dict:
+    """Оставляет в строке только запрошенные поля."""
+    return {name: row[name] for name in fields}
@@ -0,0 +1,37 @@
+import base64
+import json
+
+from src.exceptions.exceptions import InvalidCursorException
+
+
+def encode_cursor(**values) -> str:
+    """Кодирует значения ключа пагинации в непрозрачный курсор.
+
+        Args:
+            **values: Значения ключа последней записи страницы (например, `id=42`).
+
+        Returns:
+            str: Строка в формате base64url без символов выравнивания.
+    """
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, **types) -> dict:
+    """Декодирует курсор, полученный от клиента, и проверяет его содержимое.
+
+        Args:
+            cursor (str): Курсор из поля `next_cursor` предыдущего ответа.
+            **types: Ожидаемые ключи курсора и их типы (например, `id=int`).
+
+        Returns:
+            dict: Значения ключа пагинации, приведенные к ожидаемым типам.
+
+        Raises:
+            InvalidCursorException: Если курсор поврежден или не содержит нужных ключей.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return {key: type_(values[key]) for key, type_ in types.items()}
+    except (ValueError, TypeError, KeyError):
+        raise InvalidCursorException
@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+
+from src.exceptions.exceptions import UniqueObjectException
+from src.repositories.insert_batcher import InsertBatcher
+from src.schemas.books import BooksRequestAdd
+
+
+class FakeBooksTable:
+    """Заглушка BaseRepository.create_many: уникальные названия, автор до 32 символов."""
+
+    def __init__(self):
+        self.titles = set()
+        self.calls = []
+
+    async def create_many(self, data):
+        self.calls.append([item.title for item in data])
+        if any(len(item.author) > 32 for item in data):
+            # Как DataError из БД: транзакция пакета откатывается целиком
+            raise ValueError("value too long for type character varying(32)")
+        created, conflicts = [], []
+        for item in data:
+            if item.title in self.titles:
+                conflicts.append(item)
+            else:
+                self.titles.add(item.title)
+                created.append({"id": len(self.titles), **item.model_dump()})
+        return created, conflicts
+
+
+def book(title: str, author: str = "author") -> BooksRequestAdd:
+    return BooksRequestAdd(title=title, author=author)
+
+
+def run(batcher_kwargs: dict, scenario):
+    async def main():
+        table = FakeBooksTable()
+        batcher = InsertBatcher(table.create_many, **batcher_kwargs)
+        try:
+            return table, await scenario(batcher)
+        finally:
+            await batcher.close()
+    return asyncio.run(main())
+
+
+def test_batch_is_flushed_after_window():
+    async def scenario(batcher):
+        return await asyncio.gather(*(batcher.submit(book(f"book {i}")) for i in range(3)))
+
+    table, created = run({"window": 0.01, "max_size": 100}, scenario)
+    assert table.calls == [["book 0", "book 1", "book 2"]]
+    assert [obj["title"] for obj in created] == ["book 0", "book 1", "book 2"]
+
+
+def test_batch_is_flushed_at_max_size_without_waiting_for_window():
+    async def scenario(batcher):
+        async with asyncio.timeout(1):
+            return await asyncio.gather(*(batcher.submit(book(f"book {i}")) for i in range(4)))
+
+    table, created = run({"window": 60, "max_size": 2}, scenario)
+    assert table.calls == [["book 0", "book 1"], ["book 2", "book 3"]]
+    assert len(created) == 4
+
+
+def test_duplicate_title_in_batch_fails_only_its_caller():
+    async def scenario(batcher):
+        return await asyncio.gather(batcher.submit(book("same")),
+                                    batcher.submit(book("same")),
+                                    batcher.submit(book("other")),
+                                    return_exceptions=True)
+
+    table, results = run({"window": 0.01, "max_size": 100}, scenario)
+    first, duplicate, other = results
+    assert first["title"] == "same"
+    assert isinstance(duplicate, UniqueObjectException)
+    assert other["title"] == "other"
+    assert len(table.calls) == 1
+
+
+def test_failed_batch_is_retried_row_by_row():
+    async def scenario(batcher):
+        return await asyncio.gather(batcher.submit(book("good 1")),
+                                    batcher.submit(book("bad", author="x" * 40)),
+                                    batcher.submit(book("good 2")),
+                                    return_exceptions=True)
+
+    table, results = run({"window": 0.01, "max_size": 100}, scenario)
+    good_1, bad, good_2 = results
+    assert good_1["title"] == "good 1"
+    assert isinstance(bad, ValueError)
+    assert good_2["title"] == "good 2"
+    assert table.calls == [["good 1", "bad", "good 2"], ["good 1"], ["bad"], ["good 2"]]
+
+
+def test_close_flushes_pending_rows():
+    async def main():
+        table = FakeBooksTable()
+        batcher = InsertBatcher(table.create_many, window=60, max_size=100)
+        pending = asyncio.create_task(batcher.submit(book("pending")))
+        await asyncio.sleep(0)
+        await batcher.close()
+        return table, pending
+
+    table, pending = asyncio.run(main())
+    assert pending.done()
+    assert pending.result()["title"] == "pending"
+    assert table.calls == [["pending"]]
+
+
+def test_failure_of_single_row_batch_is_not_retried():
+    async def scenario(batcher):
+        with pytest.raises(ValueError):
+            await batcher.submit(book("bad", author="x" * 40))
+
+    table, _ = run({"window": 0.01, "max_size": 100}, scenario)
+    assert table.calls == [["bad"]]
@@ -0,0 +1,130 @@
+import asyncio
+
+from src.repositories.single_flight import SingleFlight
+
+
+class Load:
+    """Запрос-заглушка: считает вызовы и ждет разрешения завершиться."""
+
+    def __init__(self, result="rows", error=None):
+        self.result = result
+        self.error = error
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def test_concurrent_calls_share_one_load():
+    async def scenario():
+        flight = SingleFlight()
+        key = flight.make_key("book", "list", {"page": 1})
+        load = Load()
+        calls = [asyncio.create_task(flight.do(key, load)) for _ in range(10)]
+        await asyncio.sleep(0)
+        load.release.set()
+        results = await asyncio.gather(*calls)
+        return flight, load, results
+
+    flight, load, results = asyncio.run(scenario())
+    assert load.calls == 1
+    assert results == ["rows"] * 10
+    assert flight.stats() == {"in_flight": 0, "shared": 9}
+
+
+def test_cancelled_leader_hands_off_to_waiters():
+    async def scenario():
+        flight = SingleFlight()
+        key = flight.make_key("book", "one", {"id": 1})
+        load = Load()
+        leader = asyncio.create_task(flight.do(key, load))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(flight.do(key, load)) for _ in range(3)]
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        load.release.set()
+        results = await asyncio.gather(*waiters)
+        return load, leader, results
+
+    load, leader, results = asyncio.run(scenario())
+    assert leader.cancelled()
+    assert results == ["rows"] * 3
+    # Лидер и каждый ожидавший выполнили запрос сами
+    assert load.calls == 4
+
+
+def test_cancelled_waiter_does_not_cancel_leader():
+    async def scenario():
+        flight = SingleFlight()
+        key = flight.make_key("book", "one", {"id": 1})
+        load = Load()
+        leader = asyncio.create_task(flight.do(key, load))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(flight.do(key, load))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.sleep(0)
+        load.release.set()
+        return load, waiter, await leader
+
+    load, waiter, result = asyncio.run(scenario())
+    assert waiter.cancelled()
+    assert result == "rows"
+    assert load.calls == 1
+
+
+def test_exception_is_delivered_to_every_waiter():
+    async def scenario():
+        flight = SingleFlight()
+        key = flight.make_key("book", "count", {})
+        load = Load(error=RuntimeError("connection lost"))
+        calls = [asyncio.create_task(flight.do(key, load)) for _ in range(5)]
+        await asyncio.sleep(0)
+        load.release.set()
+        return flight, load, await asyncio.gather(*calls, return_exceptions=True)
+
+    flight, load, results = asyncio.run(scenario())
+    assert load.calls == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len({id(result) for result in results}) == 1
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_call_after_invalidate_does_not_join_older_flight():
+    async def scenario():
+        flight = SingleFlight()
+        params = {"page": 1}
+        before = Load(result="before write")
+        first = asyncio.create_task(flight.do(flight.make_key("book", "list", params), before))
+        await asyncio.sleep(0)
+        flight.invalidate("book")
+        after = Load(result="after write")
+        after.release.set()
+        second = await flight.do(flight.make_key("book", "list", params), after)
+        before.release.set()
+        return before, after, await first, second
+
+    before, after, first, second = asyncio.run(scenario())
+    assert (first, second) == ("before write", "after write")
+    assert before.calls == after.calls == 1
+
+
+def test_invalidate_is_scoped_to_namespace():
+    flight = SingleFlight()
+    book_key = flight.make_key("book", "list", {})
+    author_key = flight.make_key("author", "list", {})
+    flight.invalidate("author")
+    assert flight.make_key("book", "list", {}) == book_key
+    assert flight.make_key("author", "list", {}) != author_key
+
+
+def test_key_does_not_depend_on_param_order():
+    flight = SingleFlight()
+    assert (flight.make_key("book", "list", {"page": 1, "title": "сад"})
+            == flight.make_key("book", "list", {"title": "сад", "page": 1}))
@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.config.config import settings
+from src.models.books import Book
+from src.repositories.books import BooksRepository
+
+TRGM_INDEXES = ("ix_book_title_lower_trgm", "ix_book_author_lower_trgm")
+
+
+async def _explain(filters: dict) -> str:
+    """Возвращает план запроса списка книг с фильтрами по подстроке.
+
+        Запрос строится тем же BooksRepository._apply_filters, что и в
+        обработчиках. Последовательное сканирование запрещено, чтобы на
+        маленькой тестовой таблице планировщик выбрал индекс, если предикат
+        им вообще обслуживается.
+    """
+    if settings.DB_HOST is None:
+        pytest.skip("database is not configured")
+    engine = create_async_engine(settings.DB_URL)
+    try:
+        async with engine.connect() as connection:
+            indexes = (await connection.execute(
+                text("SELECT indexname FROM pg_indexes WHERE indexname = ANY(:names)"),
+                {"names": list(TRGM_INDEXES)},
+            )).scalars().all()
+            if set(indexes) != set(TRGM_INDEXES):
+                pytest.skip("trgm indexes are not created (pg_trgm migration not applied)")
+            query = BooksRepository(session=None)._apply_filters(select(Book.id), **filters)
+            sql = query.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+            await connection.execute(text("SET LOCAL enable_seqscan = off"))
+            plan = (await connection.execute(text(f"EXPLAIN {sql}"))).scalars().all()
+            return "\n".join(plan)
+    except (OSError, ConnectionError) as ex:
+        pytest.skip(f"database is unreachable: {ex!r}")
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.parametrize(
+    "filters, index",
+    [
+        ({"title": "Война"}, "ix_book_title_lower_trgm"),
+        ({"author": "толст"}, "ix_book_author_lower_trgm"),
+        ({"title": "100%_done"}, "ix_book_title_lower_trgm"),
+    ],
+)
+def test_substring_filter_uses_trgm_index(filters, index):
+    plan = asyncio.run(_explain(filters))
+    assert index in plan, plan